@@ -3,13 +3,24 @@ import statistics
 import math
 import io
 import json
+import time
 import asyncio
 from contextlib import redirect_stdout
+from typing import Dict
 from src.tools.youtube_api import fetch_video_statistics, resolve_channel_id
+from src.tools.valuation import valuate_channel
+from src.tools.helper.tracing import current_span, record_span, trace_span, traced
 
 from llama_index.llms.google_genai import GoogleGenAI
 from llama_index.core.agent.workflow import FunctionAgent, AgentWorkflow
 from llama_index.core.tools import FunctionTool
+from llama_index.core.instrumentation import get_dispatcher
+from llama_index.core.instrumentation.event_handlers import BaseEventHandler
+from llama_index.core.instrumentation.events.llm import (
+    LLMChatEndEvent,
+    LLMChatStartEvent,
+)
+from pydantic import Field
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -18,7 +29,35 @@ load_dotenv()
 llm = GoogleGenAI(model="gemini-2.0-flash-lite", api_key=os.getenv("GOOGLE_API_KEY"), temperature=0)
 
 
+class LLMTraceHandler(BaseEventHandler):
+    """
+    Records each LLM chat turn the agents make (start to end event) as a tracing span.
+    """
+
+    started: Dict[str, int] = Field(default_factory=dict)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "LLMTraceHandler"
+
+    def handle(self, event, **kwargs) -> None:
+        if isinstance(event, LLMChatStartEvent):
+            self.started[event.span_id] = time.time_ns()
+        elif isinstance(event, LLMChatEndEvent):
+            start_ns = self.started.pop(event.span_id, None)
+            parent = current_span()
+            # Calls made inside an explicit LLM span are already timed there
+            if start_ns is not None and not (parent and parent.kind == "llm"):
+                record_span(
+                    "llm.chat", "llm", start_ns, time.time_ns(), model=getattr(llm, "model", None)
+                )
+
+
+get_dispatcher().add_event_handler(LLMTraceHandler())
+
+
 # --- Custom Python Execution Tool ---
+@traced("tool")
 def execute_python_code(code_string: str) -> str:
     """
     Executes a given string of Python code and returns its stdout.
@@ -130,6 +169,66 @@ workflow = AgentWorkflow(
 )
 
 
+# --- Fast-path Valuation ---
+# Computes the price deterministically and only uses the LLM to explain it.
+
+NARRATIVE_PROMPT = """You are an influencer marketing consultant. Explain the following
+YouTube channel valuation to a client in a conversational, professional tone. Use the
+numbers exactly as given; do not recalculate them.
+
+Cover:
+- The recommended price for the collaboration
+- The basis for this calculation (median views and target CPM)
+- The expected range for the next video's views and what it means for the price
+- A brief summary of the key metrics
+
+Valuation:
+{valuation}"""
+
+
+def format_valuation(valuation: dict) -> str:
+    """
+    Render a valuation as Markdown without involving the LLM.
+    """
+    currency = valuation["currency"]
+    lines = [
+        f"**Recommended Price:** {valuation['recommendedPrice']:,.2f} {currency}",
+        "",
+        f"- Median views: {valuation['medianViews']:,.0f} "
+        f"(based on {valuation['videoCount']} recent videos)",
+        f"- Target CPM: {valuation['targetCpm']} {currency}",
+        f"- Conservative price: {valuation['conservativePrice']:,.2f} {currency} "
+        "(lower bound of the bootstrapped median)",
+    ]
+    views, price = valuation["viewInterval"], valuation["priceInterval"]
+    if price["lower"] is not None:
+        confidence = round(valuation["confidenceLevel"] * 100)
+        lines.append(
+            f"- {confidence}% range for the next video: "
+            f"{views['lower']:,.0f}–{views['upper']:,.0f} views "
+            f"({price['lower']:,.2f}–{price['upper']:,.2f} {currency})"
+        )
+    return "\n".join(lines)
+
+
+async def run_fast_valuation(
+    channel_name: str, target_cpm: float, currency: str, narrate: bool = True
+) -> str:
+    """
+    Value a channel with `valuate_channel` and optionally add an LLM-written narrative.
+    """
+    valuation = await valuate_channel(channel_name, target_cpm, currency)
+    summary = format_valuation(valuation)
+    if not narrate:
+        return summary
+
+    with trace_span("llm.acomplete", "llm", model=getattr(llm, "model", None)):
+        response = await llm.acomplete(
+            NARRATIVE_PROMPT.format(valuation=json.dumps(valuation, indent=2))
+        )
+    return f"{response.text.strip()}\n\n---\n\n{summary}"
+
+
 # --- Workflow Execution ---
 async def main():
     initial_query = "Calculate the recommended price for 'Matthew Berman' YouTube channel to achieve a target CPM of 25 EUR, based on their recent video views."
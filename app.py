@@ -1,45 +1,57 @@
 import gradio as gr
 import asyncio
 import os
-from agent_workflow import workflow
+from agent_workflow import run_fast_valuation
+from src.tools.helper.tracing import collect_spans
 import traceback
 
+# Analyses served at once across all users, and how many more may wait in the queue
+ANALYSIS_CONCURRENCY = int(os.getenv("APP_CONCURRENCY", "32"))
+QUEUE_SIZE = int(os.getenv("APP_QUEUE_SIZE", "128"))
+
+# Analyses in flight, keyed by (channel, target CPM, currency)
+_in_flight = {}
+
+def format_timings(collector):
+    """
+    Markdown table of where the request spent its time, one row per traced stage
+    """
+    lines = [
+        f"**Timings** ({collector.elapsed:.2f}s total)",
+        "",
+        "| Stage | Calls | Seconds | Quota units | Cache hits |",
+        "|---|---|---|---|---|",
+    ]
+    for stage in collector.summary():
+        lines.append(
+            f"| {stage['kind']}: `{stage['name']}` | {stage['count']} | {stage['seconds']:.2f} "
+            f"| {stage['quotaUnits']} | {stage['cacheHits']}/{stage['cacheHits'] + stage['cacheMisses']} |"
+        )
+    return "\n".join(lines)
+
 async def run_influencer_analysis(channel_name, target_cpm, currency):
     """
     Run the influencer marketing analysis workflow
     """
     try:
-        # Construct the query
-        query = f"Calculate the recommended price for '{channel_name}' YouTube channel to achieve a target CPM of {target_cpm} {currency}, based on their recent video views."
-        
-        # Run the workflow
-        handler = workflow.run(user_msg=query)
-        response = await handler
-        
-        # Extract the final content
-        if hasattr(response, "response"):
-            if hasattr(response.response, "content"):
-                final_content = response.response.content
-            else:
-                final_content = str(response.response)
-        elif hasattr(response, "content"):
-            final_content = response.content
-        else:
-            final_content = str(response)
+        with collect_spans() as collector:
+            # Compute the price directly; the LLM only writes the explanation
+            final_content = await run_fast_valuation(channel_name, target_cpm, currency)
         
         # Clean up the response to remove any "assistant:" prefix
         if final_content.startswith("assistant:"):
             final_content = final_content[10:].strip()
         
-        return final_content
+        return f"{final_content}\n\n---\n\n{format_timings(collector)}"
         
     except Exception as e:
         error_msg = f"An error occurred during analysis: {str(e)}\n\nFull traceback:\n{traceback.format_exc()}"
         return error_msg
 
-def analyze_influencer(channel_name, target_cpm, currency):
+async def analyze_influencer(channel_name, target_cpm, currency):
     """
-    Wrapper function to run async workflow in Gradio
+    Gradio handler, run on Gradio's own event loop. Users asking for the same
+    channel, CPM and currency at the same time share one analysis.
     """
     if not channel_name.strip():
         return "Please enter a YouTube channel name or URL."
@@ -47,14 +59,15 @@ def analyze_influencer(channel_name, target_cpm, currency):
     if not target_cpm or target_cpm <= 0:
         return "Please enter a valid target CPM value."
     
-    # Run the async function
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        result = loop.run_until_complete(run_influencer_analysis(channel_name, target_cpm, currency))
-        return result
-    finally:
-        loop.close()
+    key = (" ".join(channel_name.split()), float(target_cpm), currency)
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.create_task(run_influencer_analysis(key[0], target_cpm, currency))
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+    
+    # A user who leaves must not cancel the analysis others are waiting for
+    return await asyncio.shield(task)
 
 # Create the Gradio interface
 def create_interface():
@@ -225,7 +238,9 @@ def create_interface():
             fn=analyze_influencer,
             inputs=[channel_name, target_cpm, currency],
             outputs=[result_output],
-            show_progress=True
+            show_progress=True,
+            concurrency_limit=ANALYSIS_CONCURRENCY,
+            concurrency_id="analysis"
         )
         
         # Allow Enter key to trigger analysis
@@ -233,9 +248,14 @@ def create_interface():
             fn=analyze_influencer,
             inputs=[channel_name, target_cpm, currency],
             outputs=[result_output],
-            show_progress=True
+            show_progress=True,
+            concurrency_limit=ANALYSIS_CONCURRENCY,
+            concurrency_id="analysis"
         )
     
+    # Requests beyond the concurrency limit wait here; a full queue turns new ones away
+    demo.queue(max_size=QUEUE_SIZE)
+    
     return demo
 
 if __name__ == "__main__":
@@ -0,0 +1,370 @@
+"""
+Offline stand-in for the YouTube Data API v3.
+
+`FixtureYouTube` answers `<resource>().list(...)` calls from recorded responses
+(a JSON file of `{"resource", "part", "params", "response"}` entries) and falls
+back to deterministic synthetic channels, videos and comments. `install()` wires
+it into both the googleapiclient path (`youtube_api._youtube`) and the httpx path
+(`httpx.MockTransport`) with a configurable per-request latency.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import httplib2
+import httpx
+import numpy as np
+from googleapiclient.errors import HttpError
+
+from src.tools.helper import youtube
+from src.tools.helper.async_youtube import AsyncYouTubeClient
+from src.tools.helper.cache import cache_key
+from src.tools.helper.quota import QUOTA_COSTS, DEFAULT_QUOTA_COST
+
+SHORTS_EVERY = 3  # every third upload is a Short
+DAYS_BETWEEN_UPLOADS = 2
+COMMENT_WORDS = (
+    "love this video great content so helpful thanks amazing not bad boring "
+    "terrible awful worst best funny wow really nice editing audio"
+).split()
+
+
+def channel_id_for(index: int) -> str:
+    return "UC" + hashlib.sha1(f"channel-{index}".encode()).hexdigest()[:22]
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FixtureYouTube:
+    """
+    Deterministic YouTube backend. Channel `i` has `channel_sizes[i]` uploads, newest
+    first, one every `DAYS_BETWEEN_UPLOADS` days; every video has
+    `comments_per_video` comments. A share `error_rate` of requests fails with a
+    503 and a share `tail_rate` takes `tail_latency` extra seconds.
+    """
+
+    def __init__(
+        self,
+        channel_sizes: List[int],
+        comments_per_video: int = 200,
+        recorded: Optional[str] = None,
+        seed: int = 0,
+        error_rate: float = 0.0,
+        tail_rate: float = 0.0,
+        tail_latency: float = 1.0,
+    ):
+        self.channel_sizes = list(channel_sizes)
+        self.comments_per_video = comments_per_video
+        self.error_rate = error_rate
+        self.tail_rate = tail_rate
+        self.tail_latency = tail_latency
+        self.faults: Counter = Counter()
+        self._faults_rng = random.Random(seed)
+        self.now = datetime.utcnow().replace(microsecond=0)
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+        self._recorded: Dict[str, Dict] = {}
+        rng = np.random.default_rng(seed)
+        self._views = [
+            rng.lognormal(10, 1.0, size).astype(np.int64) for size in self.channel_sizes
+        ]
+        self._channel_index = {channel_id_for(i): i for i in range(len(self.channel_sizes))}
+        if recorded:
+            with open(recorded, encoding="utf-8") as f:
+                for entry in json.load(f):
+                    key = cache_key(entry["resource"], entry["part"], entry["params"])
+                    self._recorded[key] = entry["response"]
+
+    @property
+    def quota_used(self) -> int:
+        return sum(QUOTA_COSTS.get(r, DEFAULT_QUOTA_COST) * n for r, n in self.calls.items())
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.faults.clear()
+
+    def fault(self, resource: str) -> Tuple[bool, float]:
+        """
+        Draw the injected fault for one request: whether it fails and its extra delay.
+        """
+        with self._lock:
+            fail = self._faults_rng.random() < self.error_rate
+            slow = self._faults_rng.random() < self.tail_rate
+            if fail:
+                # Failed requests still count against the quota
+                self.calls[resource] += 1
+                self.faults["errors"] += 1
+            if slow:
+                self.faults["slow"] += 1
+        return fail, self.tail_latency if slow else 0.0
+
+    def list(self, resource: str, part: str, **params) -> Dict:
+        with self._lock:
+            self.calls[resource] += 1
+        params = {k: v for k, v in params.items() if v is not None and k != "key"}
+        recorded = self._recorded.get(cache_key(resource, part, params))
+        if recorded is not None:
+            return recorded
+        handler = getattr(self, f"_{resource}", None)
+        if handler is None:
+            raise ValueError(f"No fixture for resource: {resource}")
+        return handler(part, **params)
+
+    # --- synthetic resources ---
+
+    def video_id(self, channel: int, position: int) -> str:
+        return f"{channel:04d}v{position:06d}"
+
+    def _video(self, video_id: str) -> Optional[Dict]:
+        channel, position = int(video_id[:4]), int(video_id[5:])
+        if channel >= len(self.channel_sizes) or position >= self.channel_sizes[channel]:
+            return None
+        published = self.now - timedelta(days=DAYS_BETWEEN_UPLOADS * position, hours=1)
+        if position % SHORTS_EVERY == SHORTS_EVERY - 1:
+            duration = f"PT{15 + position % 45}S"
+        else:
+            duration = f"PT{4 + position % 40}M{position % 60}S"
+        views = int(self._views[channel][position])
+        return {
+            "id": video_id,
+            "snippet": {
+                "publishedAt": _timestamp(published),
+                "channelId": channel_id_for(channel),
+                "title": f"Benchmark video {position} of channel {channel}",
+                "description": "Lorem ipsum dolor sit amet. " * 40,
+                "thumbnails": {
+                    "high": {"url": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"}
+                },
+            },
+            "contentDetails": {"duration": duration},
+            "statistics": {
+                "viewCount": str(views),
+                "likeCount": str(views // 25),
+                "commentCount": str(self.comments_per_video),
+                "favoriteCount": "0",
+            },
+        }
+
+    def _channel(self, channel_id: str) -> Optional[Dict]:
+        index = self._channel_index.get(channel_id)
+        if index is None:
+            return None
+        views = int(self._views[index].sum())
+        return {
+            "id": channel_id,
+            "snippet": {
+                "title": f"Benchmark channel {index}",
+                "description": "A synthetic channel used for benchmarks.",
+                "customUrl": f"@benchchannel{index}",
+                "thumbnails": {},
+            },
+            "statistics": {
+                "subscriberCount": str(views // 50),
+                "viewCount": str(views),
+                "videoCount": str(self.channel_sizes[index]),
+            },
+            "contentDetails": {"relatedPlaylists": {"uploads": "UU" + channel_id[2:]}},
+        }
+
+    def _videos(self, part: str, id: str, **params) -> Dict:
+        items = [self._video(v) for v in id.split(",")]
+        return {"items": [item for item in items if item is not None]}
+
+    def _channels(self, part: str, id: Optional[str] = None, **params) -> Dict:
+        if id is None:
+            handle = (params.get("forHandle") or params.get("forUsername") or "").lstrip("@")
+            ids = [channel_id_for(int(handle[12:]))] if handle.startswith("benchchannel") else []
+        else:
+            ids = id.split(",")
+        items = [self._channel(c) for c in ids]
+        return {"items": [item for item in items if item is not None]}
+
+    def _playlistItems(
+        self,
+        part: str,
+        playlistId: str,
+        maxResults: int = 5,
+        pageToken: Optional[str] = None,
+        **params,
+    ) -> Dict:
+        channel = self._channel_index.get("UC" + playlistId[2:])
+        if channel is None:
+            raise ValueError(f"Unknown playlist: {playlistId}")
+        start = int(pageToken or 0)
+        end = min(start + int(maxResults), self.channel_sizes[channel])
+        items = []
+        for position in range(start, end):
+            video = self._video(self.video_id(channel, position))
+            items.append(
+                {
+                    "snippet": {"title": video["snippet"]["title"]},
+                    "contentDetails": {
+                        "videoId": video["id"],
+                        "videoPublishedAt": video["snippet"]["publishedAt"],
+                    },
+                }
+            )
+        response = {"items": items}
+        if end < self.channel_sizes[channel]:
+            response["nextPageToken"] = str(end)
+        return response
+
+    def _search(self, part: str, q: str = "", type: str = "video", maxResults: int = 5, **params) -> Dict:
+        if type == "channel":
+            return {
+                "items": [
+                    {"id": {"channelId": channel_id_for(i)}, "snippet": {"title": f"Benchmark channel {i}"}}
+                    for i in range(min(int(maxResults), len(self.channel_sizes)))
+                ]
+            }
+        items = []
+        for i in range(int(maxResults)):
+            channel = i % len(self.channel_sizes)
+            position = (i // len(self.channel_sizes)) % max(self.channel_sizes[channel], 1)
+            video_id = self.video_id(channel, position)
+            items.append(
+                {
+                    "id": {"videoId": video_id},
+                    "snippet": {"channelId": channel_id_for(channel), "title": video_id},
+                }
+            )
+        return {"items": items}
+
+    def _commentThreads(
+        self,
+        part: str,
+        videoId: str,
+        maxResults: int = 20,
+        pageToken: Optional[str] = None,
+        **params,
+    ) -> Dict:
+        start = int(pageToken or 0)
+        end = min(start + int(maxResults), self.comments_per_video)
+        items = []
+        for n in range(start, end):
+            words = [COMMENT_WORDS[(n * 7 + k * 3) % len(COMMENT_WORDS)] for k in range(4 + n % 9)]
+            items.append(
+                {
+                    "snippet": {
+                        "topLevelComment": {
+                            "id": f"{videoId}-c{n}",
+                            "snippet": {
+                                "authorDisplayName": f"viewer{n}",
+                                "textDisplay": " ".join(words) + ("!" if n % 5 == 0 else ""),
+                                "likeCount": n % 17,
+                                "publishedAt": _timestamp(self.now - timedelta(minutes=n)),
+                            },
+                        }
+                    }
+                }
+            )
+        response = {"items": items}
+        if end < self.comments_per_video:
+            response["nextPageToken"] = str(end)
+        return response
+
+
+class _FakeRequest:
+    def __init__(self, backend: FixtureYouTube, latency: float, resource: str, params: Dict):
+        self._backend = backend
+        self._latency = latency
+        self._resource = resource
+        self._params = params
+
+    def execute(self) -> Dict:
+        fail, delay = self._backend.fault(self._resource)
+        if self._latency + delay:
+            time.sleep(self._latency + delay)
+        if fail:
+            raise HttpError(
+                httplib2.Response({"status": 503}),
+                json.dumps({"error": {"message": "Backend Error"}}).encode(),
+            )
+        return self._backend.list(self._resource, **self._params)
+
+
+class _FakeResource:
+    def __init__(self, backend: FixtureYouTube, latency: float, resource: str):
+        self._backend = backend
+        self._latency = latency
+        self._resource = resource
+
+    def list(self, **params) -> _FakeRequest:
+        return _FakeRequest(self._backend, self._latency, self._resource, params)
+
+
+class FakeDiscoveryClient:
+    """
+    Duck-typed `googleapiclient` YouTube client: `client.videos().list(...).execute()`.
+    """
+
+    def __init__(self, backend: FixtureYouTube, latency: float = 0.0):
+        self._backend = backend
+        self._latency = latency
+
+    def __getattr__(self, resource: str):
+        if resource.startswith("_"):
+            raise AttributeError(resource)
+        return lambda: _FakeResource(self._backend, self._latency, resource)
+
+
+def mock_transport(backend: FixtureYouTube, latency: float = 0.0) -> httpx.MockTransport:
+    """
+    httpx transport that answers YouTube REST requests from `backend`.
+    """
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.rsplit("/", 1)[-1]
+        fail, delay = backend.fault(resource)
+        if latency + delay:
+            await asyncio.sleep(latency + delay)
+        if fail:
+            return httpx.Response(503, json={"error": {"message": "Backend Error"}})
+        params = dict(request.url.params)
+        part = params.pop("part")
+        for name in ("maxResults",):
+            if name in params:
+                params[name] = int(params[name])
+        try:
+            return httpx.Response(200, json=backend.list(resource, part, **params))
+        except ValueError as e:
+            return httpx.Response(404, json={"error": {"message": str(e)}})
+
+    return httpx.MockTransport(handler)
+
+
+@contextmanager
+def install(backend: FixtureYouTube, latency: float = 0.0) -> Iterator[FixtureYouTube]:
+    """
+    Route every YouTube call through `backend` for the duration of the block.
+    """
+    previous_client = youtube.youtube_api._youtube
+    previous_factory = youtube.get_async_client
+    clients: Dict = {}
+
+    def get_async_client(api_key: str) -> AsyncYouTubeClient:
+        loop = asyncio.get_running_loop()
+        if loop not in clients:
+            clients[loop] = AsyncYouTubeClient(
+                api_key, transport=mock_transport(backend, latency)
+            )
+        return clients[loop]
+
+    youtube.youtube_api._youtube = FakeDiscoveryClient(backend, latency)
+    youtube.get_async_client = get_async_client
+    try:
+        yield backend
+    finally:
+        youtube.youtube_api._youtube = previous_client
+        youtube.get_async_client = previous_factory
@@ -0,0 +1,365 @@
+"""
+Offline benchmarks for the YouTube helpers and the valuation pipeline.
+
+    python -m benchmarks.run --channel-sizes 50,500,2000 --latency 0.05 -o bench_results.json
+
+All YouTube traffic goes to `benchmarks.fake_youtube.FixtureYouTube` (optionally
+replaying recorded responses with `--fixtures`), caches are kept in memory and
+cleared before every cold run, and the narrative LLM is a stub with a fixed
+latency. Results are written as JSON so runs can be compared over time.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+# Keep every cache in memory and never require real credentials
+os.environ["YOUTUBE_CACHE_PATH"] = ""
+os.environ["YOUTUBE_SNAPSHOT_PATH"] = ""
+os.environ["YOUTUBE_QUOTA_PATH"] = ""
+# Measure request handling, not the daily quota pacing
+os.environ.setdefault("YOUTUBE_DAILY_QUOTA", str(10**9))
+os.environ.setdefault("YOUTUBE_API_KEY", "benchmark")
+
+from benchmarks.fake_youtube import FixtureYouTube, channel_id_for, install  # noqa: E402
+from src.tools.helper.cache import response_cache  # noqa: E402
+from src.tools.helper.snapshots import snapshot_store  # noqa: E402
+
+
+class StubLLM:
+    """
+    Stand-in for the Gemini LLM in `agent_workflow`: answers `acomplete` after a
+    fixed delay with a canned narrative.
+    """
+
+    def __init__(self, latency: float = 0.5):
+        self.latency = latency
+
+    class _Response:
+        def __init__(self, text: str):
+            self.text = text
+
+    async def acomplete(self, prompt: str, **kwargs) -> "StubLLM._Response":
+        await asyncio.sleep(self.latency)
+        return self._Response(f"Stub narrative for a {len(prompt)}-character prompt.")
+
+
+class Skip(Exception):
+    pass
+
+
+def clear_caches() -> None:
+    response_cache.clear()
+    snapshot_store.clear()
+
+
+def measure(
+    backend: FixtureYouTube,
+    name: str,
+    params: Dict,
+    run: Callable[[], object],
+    repeats: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> Dict:
+    """
+    Time `run` `repeats` times, calling `setup` untimed before each run.
+    """
+    result = {"name": name, "params": params}
+    timings: List[float] = []
+    try:
+        for _ in range(repeats):
+            if setup is not None:
+                setup()
+            backend.reset_counters()
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+    except Skip as e:
+        result.update(status="skipped", reason=str(e))
+        return result
+    except Exception as e:
+        result.update(status="error", error=f"{type(e).__name__}: {e}")
+        return result
+
+    result.update(
+        status="ok",
+        repeats=repeats,
+        seconds={
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "mean": statistics.fmean(timings),
+            "max": max(timings),
+        },
+        apiCalls=dict(backend.calls),
+        faults=dict(backend.faults),
+        quotaUnits=backend.quota_used,
+    )
+    return result
+
+
+def youtube_cases(backend: FixtureYouTube, args) -> List[Dict]:
+    from src.tools.helper.comments import _fetch_comments
+    from src.tools.helper.valuation import _valuate_channel, _valuate_channels
+    from src.tools.helper.youtube import _fetch_video_statistics, _search_youtube_channels
+
+    results = []
+    for index, size in enumerate(backend.channel_sizes):
+        channel_id = channel_id_for(index)
+        params = {"channelVideos": size}
+
+        results.append(
+            measure(
+                backend,
+                "fetch_video_statistics/cold",
+                params,
+                lambda: asyncio.run(_fetch_video_statistics(channel_id, 10, 6, 3)),
+                args.repeats,
+                setup=clear_caches,
+            )
+        )
+        # Snapshot kept, HTTP cache dropped: the incremental repeat-valuation path
+        results.append(
+            measure(
+                backend,
+                "fetch_video_statistics/incremental",
+                params,
+                lambda: asyncio.run(_fetch_video_statistics(channel_id, 10, 6, 3)),
+                args.repeats,
+                setup=response_cache.clear,
+            )
+        )
+        results.append(
+            measure(
+                backend,
+                "valuate_channel/cold",
+                params,
+                lambda: asyncio.run(_valuate_channel(channel_id, 20.0)),
+                args.repeats,
+                setup=clear_caches,
+            )
+        )
+        results.append(
+            measure(
+                backend,
+                "valuate_channel/cached",
+                params,
+                lambda: asyncio.run(_valuate_channel(channel_id, 20.0)),
+                args.repeats,
+            )
+        )
+
+    results.append(
+        measure(
+            backend,
+            "search_youtube_channels",
+            {"maxResults": 5},
+            lambda: _search_youtube_channels("benchmark", 5, 0),
+            args.repeats,
+            setup=clear_caches,
+        )
+    )
+
+    for max_results in (100, args.comments):
+        results.append(
+            measure(
+                backend,
+                "fetch_comments",
+                {"maxResults": max_results},
+                lambda: _fetch_comments(backend.video_id(0, 0), max_results),
+                args.repeats,
+                setup=clear_caches,
+            )
+        )
+
+    async def bulk():
+        rows = [
+            {"identifier": channel_id_for(i), "target_cpm": 20.0}
+            for i in range(len(backend.channel_sizes))
+        ]
+        async for _ in _valuate_channels(rows, concurrency=8):
+            pass
+
+    results.append(
+        measure(
+            backend,
+            "valuate_channels",
+            {"channels": len(backend.channel_sizes)},
+            lambda: asyncio.run(bulk()),
+            args.repeats,
+            setup=clear_caches,
+        )
+    )
+    return results
+
+
+def sentiment_cases(backend: FixtureYouTube, args) -> List[Dict]:
+    from src.tools.helper.comments import _comments_from_response
+    from src.tools.helper.sentiment import _batch_sentiment, _sentiment_score
+
+    response = backend.list(
+        "commentThreads", "snippet", videoId=backend.video_id(0, 0), maxResults=args.comments
+    )
+    texts = [c["text"] for c in _comments_from_response(response)]
+
+    def per_comment():
+        try:
+            for text in texts:
+                _sentiment_score(text)
+        except ImportError as e:
+            raise Skip(f"textblob unavailable: {e}")
+
+    def batch():
+        try:
+            _batch_sentiment(texts)
+        except ImportError as e:
+            raise Skip(f"textblob unavailable: {e}")
+
+    params = {"comments": len(texts)}
+    return [
+        measure(backend, "sentiment_score", params, per_comment, args.repeats),
+        measure(backend, "batch_sentiment", params, batch, args.repeats),
+    ]
+
+
+def thumbnail_cases(backend: FixtureYouTube, args) -> List[Dict]:
+    def run():
+        try:
+            from PIL import Image
+
+            from src.tools.helper import thumbnails
+        except ImportError as e:
+            raise Skip(f"thumbnail scoring dependencies unavailable: {e}")
+
+        try:
+            thumbnails._get_clip()
+        except Exception as e:
+            raise Skip(f"CLIP model not available offline: {e}")
+
+        image = Image.new("RGB", (480, 360), (200, 40, 40))
+        original = thumbnails._download_image
+        thumbnails._download_image = lambda url: image
+        try:
+            thumbnails._score_thumbnail("https://i.ytimg.com/vi/benchmark/hqdefault.jpg")
+        finally:
+            thumbnails._download_image = original
+
+    return [measure(backend, "score_thumbnail", {}, run, args.repeats)]
+
+
+def narrative_cases(backend: FixtureYouTube, args) -> List[Dict]:
+    channel_id = channel_id_for(0)
+
+    def run():
+        try:
+            import agent_workflow
+        except ImportError as e:
+            raise Skip(f"agent workflow dependencies unavailable: {e}")
+
+        previous = agent_workflow.llm
+        agent_workflow.llm = StubLLM(args.llm_latency)
+        try:
+            asyncio.run(agent_workflow.run_fast_valuation(channel_id, 20.0, "EUR"))
+        finally:
+            agent_workflow.llm = previous
+
+    return [
+        measure(
+            backend,
+            "run_fast_valuation",
+            {"llmLatency": args.llm_latency, "channelVideos": backend.channel_sizes[0]},
+            run,
+            args.repeats,
+            setup=clear_caches,
+        )
+    ]
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> Dict:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--channel-sizes",
+        default="50,500,2000",
+        help="Comma-separated number of uploads per synthetic channel (default: 50,500,2000)",
+    )
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per API request (default: 0.05)")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Seconds per stub LLM call (default: 0.5)")
+    parser.add_argument("--comments", type=int, default=1000, help="Comments per video (default: 1000)")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per case (default: 3)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of API requests failing with 503 (default: 0)")
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="Share of API requests that are slow (default: 0)")
+    parser.add_argument("--tail-latency", type=float, default=1.0, help="Extra seconds of a slow request (default: 1.0)")
+    parser.add_argument("--fixtures", help="JSON file of recorded API responses to replay")
+    parser.add_argument("-o", "--output", help="Write results as JSON to this file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    backend = FixtureYouTube(
+        [int(size) for size in args.channel_sizes.split(",")],
+        comments_per_video=args.comments,
+        recorded=args.fixtures,
+        error_rate=args.error_rate,
+        tail_rate=args.tail_rate,
+        tail_latency=args.tail_latency,
+    )
+
+    results: List[Dict] = []
+    with install(backend, args.latency):
+        for cases in (youtube_cases, sentiment_cases, thumbnail_cases, narrative_cases):
+            results.extend(cases(backend, args))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "gitRevision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency": args.latency,
+            "llmLatency": args.llm_latency,
+            "channelSizes": backend.channel_sizes,
+            "commentsPerVideo": args.comments,
+            "repeats": args.repeats,
+            "fixtures": args.fixtures,
+            "errorRate": args.error_rate,
+            "tailRate": args.tail_rate,
+            "tailLatency": args.tail_latency,
+        },
+        "results": results,
+    }
+
+    for result in results:
+        if result["status"] == "ok":
+            summary = (
+                f"{result['seconds']['median'] * 1000:9.1f} ms  "
+                f"{result['quotaUnits']:4d} units"
+            )
+        else:
+            summary = f"{result['status']}: {result.get('reason') or result.get('error')}"
+        print(f"{result['name']:38s} {json.dumps(result['params']):28s} {summary}", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    main()
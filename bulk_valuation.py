@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+import csv
+import json
+import sys
+from typing import Dict, Iterator, List
+
+from src.tools.valuation import valuate_channels
+
+
+def read_rows(path: str, default_cpm: float, default_currency: str) -> List[Dict]:
+    """
+    Read channel rows from a CSV (with a header) or JSONL file.
+
+    Recognised columns: `identifier` (or `channel`), `target_cpm` (or `cpm`) and `currency`.
+    """
+
+    def records() -> Iterator[Dict]:
+        with open(path, newline="", encoding="utf-8") as f:
+            if path.endswith((".jsonl", ".ndjson")):
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                yield from csv.DictReader(f)
+
+    rows = []
+    for record in records():
+        rows.append(
+            {
+                "identifier": (record.get("identifier") or record.get("channel") or "").strip(),
+                "target_cpm": record.get("target_cpm") or record.get("cpm") or default_cpm,
+                "currency": record.get("currency") or default_currency,
+            }
+        )
+    return rows
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Value a roster of YouTube channels and stream the results as JSONL."
+    )
+    parser.add_argument("input", help="CSV or JSONL file of channel identifiers")
+    parser.add_argument("-o", "--output", help="Output JSONL file (default: stdout)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Channels valued at once")
+    parser.add_argument(
+        "--quota-budget", type=int, default=None, help="YouTube API quota units to spend at most"
+    )
+    parser.add_argument("--cpm", type=float, default=25.0, help="Target CPM for rows without one")
+    parser.add_argument("--currency", default="EUR", help="Currency for rows without one")
+    args = parser.parse_args()
+
+    rows = read_rows(args.input, args.cpm, args.currency)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+
+    failed = 0
+    try:
+        async for result in valuate_channels(rows, args.concurrency, args.quota_budget):
+            failed += result["status"] != "ok"
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Valued {len(rows) - failed}/{len(rows)} channels", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,8 +1,10 @@
 from typing import List, Tuple
-from .helper.helpers import _predict_next_video_views
+from .helper.forecast import _predict_next_video_views
+from .helper.tracing import traced
 from llama_index.core.tools import FunctionTool
 
 
+@traced("tool")
 def predict_next_video_views(
     historical_views: List[int],
     confidence_level: float = 0.90,
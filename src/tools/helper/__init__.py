@@ -1 +1,9 @@
-from .helpers import *
\ No newline at end of file
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logging.basicConfig(level=logging.INFO)
+
+from .helpers import *
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import os
+import weakref
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+
+# Concurrency limits, overridable from the environment
+MAX_CONCURRENCY = int(os.getenv("YOUTUBE_MAX_CONCURRENCY", "8"))
+MAX_CONNECTIONS = int(os.getenv("YOUTUBE_MAX_CONNECTIONS", "16"))
+REQUEST_TIMEOUT = float(os.getenv("YOUTUBE_REQUEST_TIMEOUT", "10"))
+
+
+class YouTubeAPIError(Exception):
+    """
+    Error response from the YouTube Data API, the async counterpart of `HttpError`.
+    """
+
+    def __init__(self, status_code: int, reason: str, headers: Optional[Dict] = None):
+        super().__init__(f"<HTTP {status_code}: {reason}>")
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = dict(headers or {})
+
+
+class AsyncYouTubeClient:
+    """
+    Minimal asyncio client for the YouTube Data API v3 REST endpoints.
+
+    A single pooled `httpx.AsyncClient` keeps connections alive across calls and a
+    semaphore caps the number of requests in flight. A custom `transport` (e.g.
+    `httpx.MockTransport`) replaces the network, as the benchmarks do.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: int = MAX_CONCURRENCY,
+        max_connections: int = MAX_CONNECTIONS,
+        timeout: float = REQUEST_TIMEOUT,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.api_key = api_key
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client = httpx.AsyncClient(
+            base_url=YOUTUBE_API_URL,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+
+    async def list(self, resource: str, part: str, **params) -> Dict:
+        """
+        Async equivalent of `youtube.<resource>().list(part=..., **params).execute()`.
+        """
+        query = {k: v for k, v in params.items() if v is not None}
+        query["part"] = part
+        query["key"] = self.api_key
+
+        async with self._semaphore:
+            response = await self._client.get(f"/{resource}", params=query)
+
+        if response.status_code >= 400:
+            try:
+                reason = response.json()["error"]["message"]
+            except Exception:
+                reason = response.reason_phrase
+            raise YouTubeAPIError(response.status_code, reason, response.headers)
+        return response.json()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+# httpx connection pools and asyncio semaphores are bound to the loop that first
+# uses them, so keep one client per running event loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncYouTubeClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_client(api_key: str) -> AsyncYouTubeClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = AsyncYouTubeClient(api_key)
+        _clients[loop] = client
+    return client
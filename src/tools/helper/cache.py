@@ -0,0 +1,199 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Statistics (views, likes, subscribers) move quickly; keep them fresh
+STATISTICS_TTL = 15 * MINUTE
+
+# Default TTL per resource for responses that carry no statistics. Channel
+# metadata and uploads-playlist IDs practically never change.
+RESOURCE_TTLS = {
+    "channels": 7 * DAY,
+    "videos": DAY,
+    "search": 6 * HOUR,
+    "playlistItems": HOUR,
+    "commentThreads": 30 * MINUTE,
+}
+DEFAULT_TTL = HOUR
+
+# Expired responses are kept this long as a fallback for when quota runs low
+STALE_TTL = 7 * DAY
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "youtube_api.sqlite")
+
+
+def ttl_for(resource: str, part: str) -> float:
+    """
+    Time-to-live in seconds for a `resource().list(part=...)` response.
+    """
+    if "statistics" in part.split(","):
+        return STATISTICS_TTL
+    return RESOURCE_TTLS.get(resource, DEFAULT_TTL)
+
+
+def cache_key(resource: str, part: str, params: Dict[str, Any]) -> str:
+    """
+    Stable key for a request: resource, sorted parts and sorted non-empty parameters.
+    """
+    parts = sorted(p.strip() for p in part.split(",") if p.strip())
+    clean = {k: v for k, v in sorted(params.items()) if v is not None}
+    raw = json.dumps([resource, parts, clean], sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier TTL cache for YouTube Data API responses: an in-memory LRU in front of
+    an on-disk SQLite table that survives restarts. Each entry also remembers when
+    its response was fetched from the API.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_PATH, max_entries: int = 2048):
+        self.path = path
+        self.max_entries = max_entries
+        # key -> (expires_at, value, fetched_at)
+        self._memory: "OrderedDict[str, Tuple[float, Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+        if path:
+            try:
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, "
+                    "fetched_at REAL)"
+                )
+                # Caches written before fetch times were kept
+                columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+                if "fetched_at" not in columns:
+                    self._conn.execute("ALTER TABLE responses ADD COLUMN fetched_at REAL")
+                self._conn.execute(
+                    "DELETE FROM responses WHERE expires_at < ?", (time.time() - STALE_TTL,)
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache disabled, could not open {path}: {e}")
+                self._conn = None
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value, _ = entry
+                if expires_at >= now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, expires_at, fetched_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and row[1] >= now:
+                    value = json.loads(row[0])
+                    self._remember(key, row[1], value, row[2])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def get_stale(self, key: str, max_stale: float = STALE_TTL) -> Optional[Any]:
+        """
+        The cached response even if it expired up to `max_stale` seconds ago, for
+        when a fresh one cannot be afforded.
+        """
+        oldest = time.time() - max_stale
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[1], json.loads(row[0]), None)
+            if entry is None or entry[0] < oldest:
+                return None
+            self.stale_hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        fetched_at = time.time()
+        expires_at = fetched_at + ttl
+        with self._lock:
+            self._remember(key, expires_at, value, fetched_at)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at, fetched_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), expires_at, fetched_at),
+                )
+                self._conn.commit()
+
+    def fetched_at(self, key: str) -> Optional[float]:
+        """
+        When the cached response for `key` was fetched from the API, if known.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                return entry[2]
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT fetched_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    return row[0]
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "diskHits": self.disk_hits,
+                "misses": self.misses,
+                "staleHits": self.stale_hits,
+                "memoryEntries": len(self._memory),
+            }
+
+    def _remember(
+        self, key: str, expires_at: float, value: Any, fetched_at: Optional[float]
+    ) -> None:
+        self._memory[key] = (expires_at, value, fetched_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# Shared cache used by every YouTube helper; set YOUTUBE_CACHE_PATH="" for memory only
+response_cache = ResponseCache(os.getenv("YOUTUBE_CACHE_PATH", DEFAULT_CACHE_PATH))
@@ -0,0 +1,338 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+import numpy as np
+from googleapiclient.errors import HttpError
+
+from .async_youtube import YouTubeAPIError
+from .quota import BULK, QuotaBudget, use_quota_budget, use_request_priority
+from .sentiment import RunningSentiment, _polarity_scores
+from .video_stats import _epoch_seconds
+from .youtube import _fetch_videos_async, _youtube_list, _youtube_list_async
+
+logger = logging.getLogger(__name__)
+
+# `commentThreads().list` returns at most 100 threads per page
+COMMENTS_PAGE_SIZE = 100
+
+
+def _comments_from_response(response: Dict) -> List[Dict]:
+    comments: List[Dict] = []
+    for item in response.get("items", []):
+        top = item.get("snippet", {}).get("topLevelComment", {})
+        snip = top.get("snippet", {})
+
+        # ensure we at least have an ID and text before appending
+        comment_id = top.get("id")
+        text = snip.get("textDisplay")
+        if not comment_id or text is None:
+            continue
+
+        comments.append(
+            {
+                "id": comment_id,
+                "author": snip.get("authorDisplayName", "Unknown"),
+                "text": text,
+                "likeCount": snip.get("likeCount", 0),
+                "publishedAt": snip.get("publishedAt"),
+            }
+        )
+    return comments
+
+
+def _iter_comment_pages(
+    video_id: str, max_results: Optional[int] = None
+) -> Iterator[List[Dict]]:
+    """
+    Yield a video's comments page by page (newest first) as the API returns them,
+    without holding earlier pages. `max_results=None` pages through all comments.
+    """
+    next_page_token = None
+    fetched = 0
+
+    try:
+        while max_results is None or fetched < max_results:
+            # fetch up to 100 per page (API limit), or however many you still need
+            batch_size = COMMENTS_PAGE_SIZE
+            if max_results is not None:
+                batch_size = min(COMMENTS_PAGE_SIZE, max_results - fetched)
+            response = _youtube_list(
+                "commentThreads",
+                part="snippet",
+                videoId=video_id,
+                maxResults=batch_size,
+                order="time",  # newest first
+                pageToken=next_page_token,
+            )
+
+            page = _comments_from_response(response)
+            if max_results is not None:
+                page = page[: max_results - fetched]
+            fetched += len(page)
+            yield page
+
+            # prepare for next page (if any)
+            next_page_token = response.get("nextPageToken")
+            if not next_page_token:
+                break
+
+    except HttpError as e:
+        raise Exception(f"Error fetching comments: {e}")
+
+
+async def _aiter_comment_pages(
+    video_id: str, max_results: Optional[int] = None
+) -> AsyncIterator[List[Dict]]:
+    """
+    Async counterpart of `_iter_comment_pages`.
+    """
+    next_page_token = None
+    fetched = 0
+
+    try:
+        while max_results is None or fetched < max_results:
+            batch_size = COMMENTS_PAGE_SIZE
+            if max_results is not None:
+                batch_size = min(COMMENTS_PAGE_SIZE, max_results - fetched)
+            response = await _youtube_list_async(
+                "commentThreads",
+                part="snippet",
+                videoId=video_id,
+                maxResults=batch_size,
+                order="time",  # newest first
+                pageToken=next_page_token,
+            )
+
+            page = _comments_from_response(response)
+            if max_results is not None:
+                page = page[: max_results - fetched]
+            fetched += len(page)
+            yield page
+
+            next_page_token = response.get("nextPageToken")
+            if not next_page_token:
+                break
+
+    except YouTubeAPIError as e:
+        raise Exception(f"Error fetching comments: {e}")
+
+
+def _fetch_comments(video_id: str, max_results: int = 25) -> List[Dict]:
+    comments: List[Dict] = []
+    for page in _iter_comment_pages(video_id, max_results):
+        comments.extend(page)
+    return comments
+
+
+async def _fetch_comments_async(video_id: str, max_results: int = 25) -> List[Dict]:
+    comments: List[Dict] = []
+    async for page in _aiter_comment_pages(video_id, max_results):
+        comments.extend(page)
+    return comments
+
+
+def _add_page(running: RunningSentiment, page: List[Dict]) -> None:
+    if page:
+        running.update(
+            _polarity_scores([c["text"] for c in page]),
+            [c["likeCount"] for c in page],
+        )
+
+
+def _stream_comment_sentiment(
+    video_id: str,
+    max_results: Optional[int] = None,
+    tolerance: float = 0.02,
+    confidence: float = 0.95,
+    min_comments: int = 100,
+) -> Dict:
+    """
+    Aggregate comment sentiment page by page in O(1) memory. Stops paging as soon
+    as at least `min_comments` comments are in and the `confidence` interval for
+    the mean is within ±`tolerance`.
+    """
+    running = RunningSentiment()
+    stopped_early = False
+    for page in _iter_comment_pages(video_id, max_results):
+        _add_page(running, page)
+        if running.is_confident(tolerance, confidence, min_comments):
+            stopped_early = True
+            break
+
+    logger.info(f"Scored {running.count} comments for {video_id}")
+    return {
+        "videoId": video_id,
+        "stoppedEarly": stopped_early,
+        **running.summary(confidence),
+    }
+
+
+async def _stream_comment_sentiment_async(
+    video_id: str,
+    max_results: Optional[int] = None,
+    tolerance: float = 0.02,
+    confidence: float = 0.95,
+    min_comments: int = 100,
+) -> Dict:
+    running = RunningSentiment()
+    stopped_early = False
+    pages = _aiter_comment_pages(video_id, max_results)
+    try:
+        async for page in pages:
+            _add_page(running, page)
+            if running.is_confident(tolerance, confidence, min_comments):
+                stopped_early = True
+                break
+    finally:
+        await pages.aclose()
+
+    logger.info(f"Scored {running.count} comments for {video_id}")
+    return {
+        "videoId": video_id,
+        "stoppedEarly": stopped_early,
+        **running.summary(confidence),
+    }
+
+
+class CommentColumns:
+    """
+    Comments of many videos in columnar form. Row `i` belongs to
+    `video_ids[video_index[i]]`; its text is `text[text_offsets[i]:text_offsets[i + 1]]`.
+    """
+
+    def __init__(
+        self,
+        video_ids: List[str],
+        video_index: np.ndarray,
+        like_count: np.ndarray,
+        published_at: np.ndarray,
+        text: str,
+        text_offsets: np.ndarray,
+        errors: Dict[str, str],
+        quota_used: int,
+    ):
+        self.video_ids = video_ids
+        self.video_index = video_index
+        self.like_count = like_count
+        self.published_at = published_at  # seconds since the epoch, 0 if unknown
+        self.text = text
+        self.text_offsets = text_offsets
+        self.errors = errors  # video ID -> error message
+        self.quota_used = quota_used
+
+    def __len__(self) -> int:
+        return int(self.video_index.size)
+
+    def text_at(self, i: int) -> str:
+        return self.text[self.text_offsets[i] : self.text_offsets[i + 1]]
+
+    def texts(self) -> List[str]:
+        offsets = self.text_offsets.tolist()
+        return [self.text[a:b] for a, b in zip(offsets[:-1], offsets[1:])]
+
+    def for_video(self, video_id: str) -> np.ndarray:
+        """
+        Row indices of the comments on `video_id`.
+        """
+        return np.flatnonzero(self.video_index == self.video_ids.index(video_id))
+
+
+async def _harvest_comments(
+    video_ids: List[str],
+    per_video_limit: Optional[int] = 500,
+    max_in_flight: int = 8,
+    quota_limit: Optional[int] = None,
+    budget: Optional[QuotaBudget] = None,
+) -> CommentColumns:
+    """
+    Page through the comments of many videos concurrently.
+
+    At most `per_video_limit` comments are read per video and at most
+    `max_in_flight` page requests run at once across all videos. All requests
+    are charged to one quota budget of `quota_limit` units and scheduled as bulk
+    work; pass `budget` instead to share one with earlier requests. A video that
+    fails, e.g. because comments are disabled or the budget ran out, is listed in
+    `errors`; the comments of the other videos are still returned.
+    """
+    if budget is None:
+        budget = QuotaBudget(quota_limit)
+    semaphore = asyncio.Semaphore(max_in_flight)
+    video_ids = list(dict.fromkeys(video_ids))
+    errors: Dict[str, str] = {}
+
+    async def harvest(video_id: str) -> List[Dict]:
+        use_quota_budget(budget)
+        use_request_priority(BULK)
+        comments: List[Dict] = []
+        pages = _aiter_comment_pages(video_id, per_video_limit)
+        try:
+            while True:
+                async with semaphore:
+                    try:
+                        page = await pages.__anext__()
+                    except StopAsyncIteration:
+                        break
+                comments.extend(page)
+        except Exception as e:
+            logger.warning(f"Stopped harvesting comments for {video_id}: {e}")
+            errors[video_id] = str(e)
+        finally:
+            await pages.aclose()
+        return comments
+
+    per_video = await asyncio.gather(*(harvest(v) for v in video_ids))
+
+    video_index: List[int] = []
+    like_count: List[int] = []
+    published_at: List[int] = []
+    texts: List[str] = []
+    for i, comments in enumerate(per_video):
+        for comment in comments:
+            video_index.append(i)
+            like_count.append(comment["likeCount"])
+            published_at.append(_epoch_seconds(comment["publishedAt"]))
+            texts.append(comment["text"])
+
+    text_offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum([len(t) for t in texts], out=text_offsets[1:])
+
+    logger.info(
+        f"Harvested {len(texts)} comments from {len(video_ids)} videos "
+        f"using {budget.used} quota units"
+    )
+    return CommentColumns(
+        video_ids=video_ids,
+        video_index=np.array(video_index, dtype=np.int32),
+        like_count=np.array(like_count, dtype=np.int64),
+        published_at=np.array(published_at, dtype=np.int64),
+        text="".join(texts),
+        text_offsets=text_offsets,
+        errors=errors,
+        quota_used=budget.used,
+    )
+
+
+async def _harvest_channel_comments(
+    channel_id: str,
+    max_videos: int = 30,
+    per_video_limit: Optional[int] = 500,
+    max_in_flight: int = 8,
+    quota_limit: Optional[int] = None,
+) -> CommentColumns:
+    """
+    Harvest the comments of a channel's `max_videos` most recent uploads. Listing
+    the uploads is bulk work charged to the same `quota_limit` budget.
+    """
+    budget = QuotaBudget(quota_limit)
+
+    async def list_uploads() -> List[Dict]:
+        # Runs as its own task so the budget and priority stay out of the caller's context
+        use_quota_budget(budget)
+        use_request_priority(BULK)
+        return await _fetch_videos_async(channel_id, max_videos)
+
+    videos = await asyncio.create_task(list_uploads())
+    return await _harvest_comments(
+        [video["id"] for video in videos], per_video_limit, max_in_flight, budget=budget
+    )
@@ -0,0 +1,34 @@
+import logging
+import re
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# ISO 8601 durations as used by `contentDetails.duration`, e.g. "PT4M13S" or
+# "P1DT2H3M". Live streams report "P0D".
+_DURATION_RE = re.compile(
+    r"^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$"
+)
+
+
+@lru_cache(maxsize=8192)
+def _duration_seconds(duration: str) -> int:
+    """
+    Length in whole seconds of an ISO 8601 duration such as "PT1H2M3S" or "P1DT2H".
+    Missing or malformed durations count as 0.
+    """
+    match = _DURATION_RE.match(duration or "")
+    if match is None or duration in ("P", "PT") or duration.endswith("T"):
+        if duration:
+            logger.warning(f"Unrecognised video duration: {duration}")
+        return 0
+
+    weeks, days, hours, minutes, seconds = match.groups()
+    return int(
+        int(weeks or 0) * 604800
+        + int(days or 0) * 86400
+        + int(hours or 0) * 3600
+        + int(minutes or 0) * 60
+        + float(seconds or 0)
+    )
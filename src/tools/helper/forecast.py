@@ -0,0 +1,253 @@
+from functools import lru_cache
+from statistics import NormalDist
+from typing import List, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Bootstrap resamples and RNG seed; a fixed seed keeps prices reproducible
+BOOTSTRAP_RESAMPLES = 10_000
+BOOTSTRAP_SEED = 0
+# Resampled values materialised at once; channels are bootstrapped in chunks of this size
+BOOTSTRAP_CHUNK_ELEMENTS = 2**20
+
+DAY = 24 * 60 * 60
+
+
+def _predict_next_video_views(
+    historical_views: List[int],
+    confidence_level: float = 0.90,
+    interval_type: Literal["lower", "upper", "two-sided"] = "two-sided",
+) -> Tuple[float, float]:
+    """
+    Predict a one‑ or two‑sided confidence interval for the next video's view count,
+    assuming a log‑normal model.
+    """
+    if not len(historical_views):
+        raise ValueError("Historical views list cannot be empty")
+    lower, upper = _predict_next_video_views_batch(
+        [historical_views], confidence_level, interval_type
+    )
+    return float(lower[0]), float(upper[0])
+
+
+def _pad_histories(histories: Sequence[Sequence[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack ragged view histories into a zero-padded `(channels, max_len)` array and
+    the mask of its real entries.
+    """
+    lengths = np.fromiter((len(h) for h in histories), np.int64, len(histories))
+    width = int(lengths.max(initial=0))
+    mask = np.arange(width) < lengths[:, None]
+    values = np.zeros(mask.shape)
+    if width:
+        values[mask] = np.concatenate([np.asarray(h, dtype=float) for h in histories])
+    return values, mask
+
+
+def _predict_next_video_views_batch(
+    historical_views: Union[Sequence[Sequence[float]], np.ndarray],
+    confidence_level: float = 0.90,
+    interval_type: Literal["lower", "upper", "two-sided"] = "two-sided",
+    mask: Optional[np.ndarray] = None,
+    weights: Optional[Union[Sequence[Sequence[float]], np.ndarray]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `_predict_next_video_views` for many channels in one NumPy pass.
+
+    `historical_views` is either a list of per-channel view histories of any
+    length, or a padded 2-D array whose real entries are flagged by `mask`
+    (defaults to the finite entries). With the location fixed at 0 the log-normal
+    MLE is closed form: mu and sigma are the mean and the population (ddof=0)
+    standard deviation of the log views, so no optimizer is needed. Optional
+    `weights`, shaped like the views, turn those into weighted moments (e.g.
+    `_recency_weights`).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: lower and upper bounds per channel, with
+        -inf/inf for the open side of one-sided intervals and NaN for channels
+        without any history.
+    """
+    if interval_type not in ("lower", "upper", "two-sided"):
+        raise ValueError(f"Invalid interval_type: {interval_type}")
+
+    if isinstance(historical_views, np.ndarray) and historical_views.ndim == 2:
+        values = historical_views.astype(float)
+        mask = np.isfinite(values) if mask is None else np.asarray(mask, dtype=bool)
+    else:
+        values, mask = _pad_histories(historical_views)
+
+    if np.any(values[mask] <= 0):
+        bad = np.flatnonzero(np.any(mask & (values <= 0), axis=1))
+        raise ValueError(
+            f"All view counts must be positive to fit a log‑normal (rows {bad.tolist()})"
+        )
+
+    if weights is None:
+        w = mask.astype(float)
+    elif isinstance(weights, np.ndarray) and weights.ndim == 2:
+        w = np.where(mask, weights, 0.0)
+    else:
+        w = np.where(mask, _pad_histories(weights)[0], 0.0)
+
+    totals = w.sum(axis=1)
+    logs = np.where(mask, np.log(np.where(mask, values, 1.0)), 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mu = (w * logs).sum(axis=1) / totals
+        sigma = np.sqrt((w * (logs - mu[:, None]) ** 2).sum(axis=1) / totals)
+
+    alpha = 1.0 - confidence_level
+    normal = NormalDist()
+
+    def quantile(q: float) -> np.ndarray:
+        return np.exp(mu + sigma * normal.inv_cdf(q))
+
+    if interval_type == "lower":
+        # one‑sided lower: P(X ≥ L) = confidence_level
+        return quantile(alpha), np.full(mu.shape, np.inf)
+
+    if interval_type == "upper":
+        # one‑sided upper: P(X ≤ U) = confidence_level
+        return np.full(mu.shape, -np.inf), quantile(confidence_level)
+
+    # central interval: cut off α/2 in each tail
+    return quantile(alpha / 2), quantile(1 - alpha / 2)
+
+
+def _recency_weights(
+    published_at: np.ndarray, half_life_days: Optional[float]
+) -> Optional[np.ndarray]:
+    """
+    Exponential recency weights for videos published at the given epoch seconds: a
+    video `half_life_days` older than the newest upload counts half as much. Ages
+    are measured from the newest upload, so its weight is 1 and the weights cannot
+    all underflow. Returns None (equal weights) when no half-life is set.
+    """
+    if half_life_days is None:
+        return None
+    if not half_life_days > 0:
+        raise ValueError(f"half_life_days must be positive, got {half_life_days}")
+    published_at = np.asarray(published_at, dtype=float)
+    if not published_at.size:
+        return np.ones(0)
+    ages = (published_at.max() - published_at) / DAY
+    return 0.5 ** (ages / half_life_days)
+
+
+def _weighted_median(values: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Median along the last axis, weighted when `weights` (same shape) is given: the
+    smallest value whose cumulative weight reaches half the total, averaged with the
+    next one on an exact split so equal weights match `np.median`.
+    """
+    if weights is None:
+        return np.median(values, axis=-1)
+    order = np.argsort(values, axis=-1)
+    sorted_values = np.take_along_axis(values, order, axis=-1)
+    cumulative = np.cumsum(np.take_along_axis(weights, order, axis=-1), axis=-1)
+    half = cumulative[..., -1:] / 2
+    position = (cumulative < half).sum(axis=-1, keepdims=True)
+    median = np.take_along_axis(sorted_values, position, axis=-1)
+    split = np.isclose(np.take_along_axis(cumulative, position, axis=-1), half)
+    following = np.take_along_axis(
+        sorted_values, np.minimum(position + 1, values.shape[-1] - 1), axis=-1
+    )
+    return np.where(split, (median + following) / 2, median)[..., 0]
+
+
+@lru_cache(maxsize=64)
+def _resample_indices(
+    n: int, resamples: int = BOOTSTRAP_RESAMPLES, seed: int = BOOTSTRAP_SEED
+) -> np.ndarray:
+    """
+    Read-only `(resamples, n)` bootstrap index matrix, drawn once per `n` and shared
+    by every channel with that many videos.
+    """
+    indices = np.random.default_rng(seed).integers(0, n, size=(resamples, n))
+    indices.flags.writeable = False
+    return indices
+
+
+def _bootstrap_median_interval_batch(
+    historical_views: np.ndarray,
+    confidence_level: float = 0.90,
+    interval_type: Literal["lower", "upper", "two-sided"] = "two-sided",
+    weights: Optional[np.ndarray] = None,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = BOOTSTRAP_SEED,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Percentile bootstrap interval of the (optionally weighted) median views for
+    channels with equally long histories, given as a `(channels, n)` array.
+
+    Unlike the log-normal interval this makes no distributional assumption, so on
+    volatile creators its lower bound is a conservative basis for pricing. Channels
+    are resampled in chunks so memory stays bounded however many are passed.
+    """
+    if interval_type not in ("lower", "upper", "two-sided"):
+        raise ValueError(f"Invalid interval_type: {interval_type}")
+
+    values = np.asarray(historical_views, dtype=float)
+    if values.ndim != 2 or values.shape[1] == 0:
+        raise ValueError("Historical views must be a non-empty (channels, n) array")
+
+    if weights is not None:
+        weights = np.asarray(weights, dtype=float)
+
+    alpha = 1.0 - confidence_level
+    if interval_type == "lower":
+        levels = [alpha]
+    elif interval_type == "upper":
+        levels = [confidence_level]
+    else:
+        levels = [alpha / 2, 1 - alpha / 2]
+
+    indices = _resample_indices(values.shape[1], resamples, seed)
+    chunk = max(1, BOOTSTRAP_CHUNK_ELEMENTS // indices.size)
+    bounds = np.empty((len(levels), len(values)))
+    for start in range(0, len(values), chunk):
+        rows = slice(start, start + chunk)
+        samples = values[rows][:, indices]  # (chunk, resamples, n)
+        sample_weights = None if weights is None else weights[rows][:, indices]
+        medians = _weighted_median(samples, sample_weights)  # (chunk, resamples)
+        bounds[:, rows] = np.quantile(medians, levels, axis=1)
+
+    if interval_type == "lower":
+        return bounds[0], np.full(len(values), np.inf)
+    if interval_type == "upper":
+        return np.full(len(values), -np.inf), bounds[0]
+    return bounds[0], bounds[1]
+
+
+def _bootstrap_median_intervals(
+    historical_views: Sequence[Sequence[float]],
+    confidence_level: float = 0.90,
+    interval_type: Literal["lower", "upper", "two-sided"] = "two-sided",
+    weights: Optional[Sequence[Sequence[float]]] = None,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = BOOTSTRAP_SEED,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `_bootstrap_median_interval_batch` for ragged histories: channels are grouped by
+    history length so each group reuses one resample-index matrix. Channels without
+    history get NaN.
+    """
+    lower = np.full(len(historical_views), np.nan)
+    upper = np.full(len(historical_views), np.nan)
+    groups = {}
+    for i, views in enumerate(historical_views):
+        if len(views):
+            groups.setdefault(len(views), []).append(i)
+
+    for rows in groups.values():
+        group_weights = None
+        if weights is not None:
+            group_weights = np.array([weights[i] for i in rows], dtype=float)
+        lower[rows], upper[rows] = _bootstrap_median_interval_batch(
+            np.array([historical_views[i] for i in rows], dtype=float),
+            confidence_level,
+            interval_type,
+            group_weights,
+            resamples,
+            seed,
+        )
+    return lower, upper
@@ -0,0 +1,366 @@
+import asyncio
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+logger = logging.getLogger(__name__)
+
+DAY = 24 * 60 * 60
+
+# Quota units charged per `list` call by the YouTube Data API v3
+QUOTA_COSTS = {
+    "search": 100,
+    "videos": 1,
+    "channels": 1,
+    "playlistItems": 1,
+    "commentThreads": 1,
+}
+DEFAULT_QUOTA_COST = 1
+
+# Daily project quota, by default the 10,000 units Google grants every project
+DAILY_QUOTA = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+# Share of the daily quota kept for interactive requests; bulk jobs stop before it
+INTERACTIVE_RESERVE = float(os.getenv("YOUTUBE_INTERACTIVE_RESERVE", "0.2"))
+# Below this share of the daily quota left, stale cached responses are preferred
+CONSERVE_BELOW = float(os.getenv("YOUTUBE_QUOTA_CONSERVE_BELOW", "0.1"))
+# Units bulk jobs may spend in a burst before being paced at the daily rate; unset
+# means an hour of refill
+BURST_UNITS: Optional[int] = (
+    int(os.environ["YOUTUBE_QUOTA_BURST"]) if os.getenv("YOUTUBE_QUOTA_BURST") else None
+)
+# Longest a bulk request may wait for quota tokens; longer waits are refused
+MAX_BULK_WAIT = float(os.getenv("YOUTUBE_QUOTA_MAX_WAIT", "3600"))
+# Seconds between writes of the usage counter; a crash loses at most this much usage
+SAVE_INTERVAL = float(os.getenv("YOUTUBE_QUOTA_SAVE_INTERVAL", "5"))
+
+DEFAULT_QUOTA_PATH = os.path.join(".cache", "youtube_quota.sqlite")
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+# The quota resets at midnight Pacific time
+try:
+    _QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except ZoneInfoNotFoundError:
+    _QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+
+class QuotaExceededError(Exception):
+    pass
+
+
+class QuotaBudget:
+    """
+    Quota allowance for a unit of work such as a bulk run. Requests that would
+    exceed the limit fail with `QuotaExceededError` instead of being sent.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.limit is None:
+            return None
+        return max(self.limit - self.used, 0)
+
+    def charge(self, resource: str) -> int:
+        cost = QUOTA_COSTS.get(resource, DEFAULT_QUOTA_COST)
+        with self._lock:
+            if self.limit is not None and self.used + cost > self.limit:
+                raise QuotaExceededError(
+                    f"Quota budget exhausted: {resource} needs {cost} units, "
+                    f"{self.limit - self.used} of {self.limit} left"
+                )
+            self.used += cost
+        return cost
+
+    def refund(self, cost: int) -> None:
+        with self._lock:
+            self.used -= cost
+
+
+def _quota_day() -> str:
+    return datetime.now(_QUOTA_TIMEZONE).date().isoformat()
+
+
+class QuotaScheduler:
+    """
+    Process-wide gate in front of the YouTube API's daily quota.
+
+    Interactive requests may spend the whole daily quota and never wait. Bulk
+    requests draw from a token bucket of `burst` units refilled at the daily rate
+    (so a big job cannot drain the day's quota in minutes) and are refused once only
+    the interactive reserve is left. A bulk request short of tokens reserves them
+    and waits until the bucket has refilled, so waiters are served in arrival order;
+    one that would wait longer than `max_wait` is refused instead.
+    Usage per quota day is kept in SQLite, written at most every `save_interval`
+    seconds, so a restart does not forget it.
+    """
+
+    def __init__(
+        self,
+        daily_limit: int = DAILY_QUOTA,
+        burst: Optional[int] = BURST_UNITS,
+        reserve: float = INTERACTIVE_RESERVE,
+        max_wait: float = MAX_BULK_WAIT,
+        save_interval: float = SAVE_INTERVAL,
+        path: Optional[str] = DEFAULT_QUOTA_PATH,
+    ):
+        self.daily_limit = daily_limit
+        self.burst = int(daily_limit * 3600 / DAY) if burst is None else burst
+        self.max_wait = max_wait
+        self.reserve = reserve
+        self.save_interval = save_interval
+        self.by_resource: Counter = Counter()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._day = _quota_day()
+        self._used = 0
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._dirty = False
+        self._saved = time.monotonic()
+
+        if path:
+            try:
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS usage (day TEXT PRIMARY KEY, used INTEGER NOT NULL)"
+                )
+                self._conn.commit()
+                row = self._conn.execute(
+                    "SELECT used FROM usage WHERE day = ?", (self._day,)
+                ).fetchone()
+                self._used = row[0] if row else 0
+                atexit.register(self.flush)
+            except sqlite3.Error as e:
+                logger.warning(f"Quota usage kept in memory, could not open {path}: {e}")
+                self._conn = None
+
+    @property
+    def used(self) -> int:
+        with self._lock:
+            self._roll_over()
+            return self._used
+
+    @property
+    def remaining(self) -> int:
+        return max(self.daily_limit - self.used, 0)
+
+    @property
+    def conserving(self) -> bool:
+        """
+        True when little quota is left and cached data, even stale, should be used.
+        """
+        return self.remaining < self.daily_limit * CONSERVE_BELOW
+
+    def acquire(self, resource: str, priority: Optional[str] = None) -> int:
+        """
+        Charge one `resource().list` call, sleeping while a bulk request waits for
+        its reserved tokens. Returns its cost; raises `QuotaExceededError` if it may
+        not be sent.
+        """
+        cost, wait = self._reserve(resource, priority or _current_priority.get())
+        if wait:
+            try:
+                time.sleep(wait)
+            except BaseException:
+                self._release(resource, cost)
+                raise
+        return cost
+
+    async def acquire_async(self, resource: str, priority: Optional[str] = None) -> int:
+        """
+        `acquire` that waits without blocking the event loop.
+        """
+        cost, wait = self._reserve(resource, priority or _current_priority.get())
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                self._release(resource, cost)
+                raise
+        return cost
+
+    def exhaust(self) -> None:
+        """
+        Mark today's quota as spent, e.g. after the API answered `quotaExceeded`.
+        """
+        with self._lock:
+            self._roll_over()
+            self._used = max(self._used, self.daily_limit)
+            self._dirty = True
+            self._save(force=True)
+        logger.warning("YouTube API reported the daily quota as exceeded")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._roll_over()
+            return {
+                "day": self._day,
+                "used": self._used,
+                "dailyLimit": self.daily_limit,
+                "byResource": dict(self.by_resource),
+            }
+
+    def flush(self) -> None:
+        """
+        Write pending usage to SQLite now.
+        """
+        with self._lock:
+            self._save(force=True)
+
+    def _reserve(self, resource: str, priority: str) -> Tuple[int, float]:
+        """
+        Charge `resource` and return `(cost, seconds)` the request must wait first.
+        Bulk requests take their tokens even when the bucket runs short, leaving it in
+        debt, so each waits for the refill of its own tokens and those reserved
+        before it. Raises `QuotaExceededError` if that wait would exceed `max_wait`.
+        """
+        cost = QUOTA_COSTS.get(resource, DEFAULT_QUOTA_COST)
+        with self._lock:
+            self._roll_over()
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._refilled) * self.daily_limit / DAY
+            )
+            self._refilled = now
+
+            limit = self.daily_limit
+            if priority == BULK:
+                limit = int(self.daily_limit * (1 - self.reserve))
+            if self._used + cost > limit:
+                raise QuotaExceededError(
+                    f"Daily YouTube quota exhausted for {priority} requests: {resource} "
+                    f"needs {cost} units, {max(limit - self._used, 0)} of {limit} left"
+                )
+
+            wait = 0.0
+            if priority == BULK:
+                needed = min(cost, self.burst)
+                wait = max(needed - self._tokens, 0.0) * DAY / self.daily_limit
+                if wait > self.max_wait:
+                    raise QuotaExceededError(
+                        f"YouTube quota rate limit for bulk requests: {resource} would "
+                        f"wait {wait:.0f}s for tokens, more than {self.max_wait:.0f}s"
+                    )
+                self._tokens -= cost
+            else:
+                # Interactive calls may overdraw the bucket, which slows bulk jobs down
+                self._tokens = max(self._tokens - cost, min(self._tokens, -float(self.burst)))
+            self._used += cost
+            self.by_resource[resource] += cost
+            self._dirty = True
+            self._save()
+        if wait:
+            logger.info(f"Bulk {resource} request paced: waiting {wait:.1f}s for quota tokens")
+        return cost, wait
+
+    def _release(self, resource: str, cost: int) -> None:
+        """
+        Return the tokens and usage of a request abandoned while waiting.
+        """
+        with self._lock:
+            self._tokens += cost
+            self._used = max(self._used - cost, 0)
+            self.by_resource[resource] -= cost
+            self._dirty = True
+            self._save()
+
+    def _roll_over(self) -> None:
+        day = _quota_day()
+        if day != self._day:
+            self._save(force=True)
+            self._day = day
+            self._used = 0
+            self.by_resource.clear()
+
+    def _save(self, force: bool = False) -> None:
+        if self._conn is None or not self._dirty:
+            return
+        now = time.monotonic()
+        if not force and now - self._saved < self.save_interval:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO usage (day, used) VALUES (?, ?)",
+                (self._day, self._used),
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save quota usage: {e}")
+            return
+        self._dirty = False
+        self._saved = now
+
+
+# Shared by every YouTube helper; set YOUTUBE_QUOTA_PATH="" to keep usage in memory
+quota_scheduler = QuotaScheduler(path=os.getenv("YOUTUBE_QUOTA_PATH", DEFAULT_QUOTA_PATH))
+
+
+_current_budget: ContextVar[Optional[QuotaBudget]] = ContextVar(
+    "quota_budget", default=None
+)
+_current_priority: ContextVar[str] = ContextVar("quota_priority", default=INTERACTIVE)
+
+
+def use_quota_budget(budget: Optional[QuotaBudget]) -> None:
+    """
+    Charge API calls made from the current context (e.g. an asyncio task) to `budget`.
+    """
+    _current_budget.set(budget)
+
+
+def use_request_priority(priority: str) -> None:
+    """
+    Schedule API calls made from the current context as `INTERACTIVE` (the default)
+    or `BULK`.
+    """
+    _current_priority.set(priority)
+
+
+def request_priority() -> str:
+    return _current_priority.get()
+
+
+def charge_quota(resource: str) -> int:
+    """
+    Charge one `resource().list` call to the active budget, if any, and to the daily
+    quota, and return its cost.
+    """
+    budget = _current_budget.get()
+    cost = budget.charge(resource) if budget is not None else 0
+    try:
+        return quota_scheduler.acquire(resource)
+    except BaseException:
+        if budget is not None:
+            budget.refund(cost)
+        raise
+
+
+async def charge_quota_async(resource: str) -> int:
+    """
+    Async counterpart of `charge_quota`.
+    """
+    budget = _current_budget.get()
+    cost = budget.charge(resource) if budget is not None else 0
+    try:
+        return await quota_scheduler.acquire_async(resource)
+    except BaseException:
+        if budget is not None:
+            budget.refund(cost)
+        raise
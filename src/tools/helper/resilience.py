@@ -0,0 +1,291 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import httplib2
+import httpx
+from googleapiclient.errors import HttpError
+
+from .async_youtube import YouTubeAPIError
+from .tracing import annotate
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Retries after the first attempt, and the full-jitter backoff bounds in seconds
+MAX_RETRIES = int(os.getenv("YOUTUBE_MAX_RETRIES", "3"))
+BACKOFF_BASE = float(os.getenv("YOUTUBE_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX = float(os.getenv("YOUTUBE_BACKOFF_MAX", "8"))
+# Longest Retry-After honoured; a longer one fails the call instead of stalling it
+MAX_RETRY_AFTER = float(os.getenv("YOUTUBE_MAX_RETRY_AFTER", "30"))
+
+# Consecutive transient failures that open an endpoint's circuit, and how long it stays open
+BREAKER_THRESHOLD = int(os.getenv("YOUTUBE_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET = float(os.getenv("YOUTUBE_BREAKER_RESET", "30"))
+
+# Seconds before a slow interactive call is duplicated; 0 disables hedging
+HEDGE_AFTER = float(os.getenv("YOUTUBE_HEDGE_AFTER", "0"))
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+def unavailable_error(
+    endpoint: str, error: BaseException, asynchronous: bool = False
+) -> Exception:
+    """
+    A 503 API error standing in for an outage (open circuit, network failure) so
+    callers handle it like any failed response: `YouTubeAPIError` for the async
+    client, `HttpError` otherwise.
+    """
+    message = str(error)
+    if not isinstance(error, CircuitOpenError):
+        message = f"YouTube {endpoint} endpoint unavailable: {error}"
+    if asynchronous:
+        return YouTubeAPIError(503, message)
+    content = json.dumps({"error": {"code": 503, "message": message}}).encode("utf-8")
+    return HttpError(httplib2.Response({"status": 503}), content)
+
+
+def _status_and_message(error: BaseException):
+    if isinstance(error, HttpError):
+        return error.resp.status, str(error)
+    if isinstance(error, YouTubeAPIError):
+        return error.status_code, error.reason
+    return None, str(error)
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    True for failures worth retrying: 429/5xx responses, per-user rate limits
+    (403 `rateLimitExceeded`) and network errors. Quota exhaustion is not transient.
+    """
+    if isinstance(error, (OSError, httplib2.HttpLib2Error, httpx.TransportError)):
+        return True
+    status, message = _status_and_message(error)
+    if status in RETRYABLE_STATUS:
+        return True
+    message = message.lower()
+    return status == 403 and ("ratelimitexceeded" in message or "rate limit" in message)
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """
+    Seconds requested by a `Retry-After` header (delta-seconds or HTTP date), if any.
+    """
+    if isinstance(error, HttpError):
+        value = error.resp.get("retry-after")
+    elif isinstance(error, YouTubeAPIError):
+        value = {k.lower(): v for k, v in error.headers.items()}.get("retry-after")
+    else:
+        return None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, error: Optional[BaseException] = None) -> float:
+    """
+    Full-jitter exponential backoff before retry number `attempt` (0-based),
+    stretched to any `Retry-After` the server asked for.
+    """
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+    requested = retry_after(error) if error is not None else None
+    if requested is not None:
+        delay = max(delay, requested)
+    return delay
+
+
+class CircuitBreaker:
+    """
+    Fails calls to an endpoint fast after `threshold` consecutive transient
+    failures. After `reset_timeout` seconds one probe call is let through: success
+    closes the circuit again, failure keeps it open for another period.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: int = BREAKER_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET,
+    ):
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> None:
+        """
+        Raise `CircuitOpenError` unless a call may be sent now.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            waited = time.monotonic() - self.opened_at
+            if waited >= self.reset_timeout and not self._probing:
+                self._probing = True
+                return
+            raise CircuitOpenError(
+                f"YouTube {self.name} endpoint unavailable after {self.failures} failures, "
+                f"retrying in {max(self.reset_timeout - waited, 0):.0f}s"
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.threshold:
+                if self.opened_at is None:
+                    logger.warning(
+                        f"Opening circuit for YouTube {self.name} after {self.failures} failures"
+                    )
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+    def release(self) -> None:
+        """
+        Let another probe through after one that never reached the endpoint.
+        """
+        with self._lock:
+            self._probing = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def circuit_breaker(endpoint: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = _breakers[endpoint] = CircuitBreaker(endpoint)
+        return breaker
+
+
+def _settle(
+    breaker: CircuitBreaker, endpoint: str, attempt: int, error: BaseException
+) -> float:
+    """
+    Record a failed attempt and return the delay before retrying, or re-raise the
+    error when it is not worth another attempt.
+    """
+    if not is_transient(error):
+        if isinstance(error, (HttpError, YouTubeAPIError)):
+            # The endpoint answered, so it is healthy
+            breaker.record_success()
+        else:
+            breaker.release()
+        raise error
+    breaker.record_failure()
+    delay = backoff_delay(attempt, error)
+    if attempt >= MAX_RETRIES or delay > MAX_RETRY_AFTER:
+        raise error
+    logger.info(f"Retrying YouTube {endpoint} in {delay:.2f}s after: {error}")
+    annotate(retries=attempt + 1)
+    return delay
+
+
+def call_with_retries(endpoint: str, send: Callable[[], T]) -> T:
+    """
+    Call `send` through the endpoint's circuit breaker, retrying transient
+    failures with jittered exponential backoff.
+    """
+    breaker = circuit_breaker(endpoint)
+    attempt = 0
+    while True:
+        breaker.allow()
+        try:
+            result = send()
+        except Exception as e:
+            time.sleep(_settle(breaker, endpoint, attempt, e))
+            attempt += 1
+            continue
+        breaker.record_success()
+        return result
+
+
+async def _hedged(send: Callable[[], Awaitable[T]], hedge_after: float) -> T:
+    """
+    Await `send()`, starting a duplicate if it has not answered within
+    `hedge_after` seconds. The first success wins and the other call is cancelled.
+    """
+    first = asyncio.ensure_future(send())
+    pending = {first}
+    error: Optional[BaseException] = None
+    try:
+        done, pending = await asyncio.wait(pending, timeout=hedge_after)
+        if done:
+            return first.result()
+
+        annotate(hedged=True)
+        pending.add(asyncio.ensure_future(send()))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def call_with_retries_async(
+    endpoint: str,
+    send: Callable[[], Awaitable[T]],
+    hedge_after: Optional[float] = None,
+) -> T:
+    """
+    Async `call_with_retries`. With `hedge_after` set, each attempt is hedged
+    with a duplicate request if it is slower than that.
+    """
+    breaker = circuit_breaker(endpoint)
+    attempt = 0
+    while True:
+        breaker.allow()
+        try:
+            if hedge_after:
+                result = await _hedged(send, hedge_after)
+            else:
+                result = await send()
+        except Exception as e:
+            await asyncio.sleep(_settle(breaker, endpoint, attempt, e))
+            attempt += 1
+            continue
+        breaker.record_success()
+        return result
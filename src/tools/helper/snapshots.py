@@ -0,0 +1,248 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from .durations import _duration_seconds
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_PATH = os.path.join(".cache", "channel_snapshots.sqlite")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS channels "
+    "(channel_id TEXT PRIMARY KEY, uploads_playlist_id TEXT NOT NULL, updated_at REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS videos "
+    "(video_id TEXT PRIMARY KEY, channel_id TEXT NOT NULL, published_at TEXT NOT NULL, "
+    "duration TEXT NOT NULL, duration_seconds INTEGER NOT NULL DEFAULT 0)",
+    "CREATE INDEX IF NOT EXISTS videos_by_channel ON videos (channel_id, published_at)",
+    "CREATE TABLE IF NOT EXISTS stats "
+    "(video_id TEXT NOT NULL, fetched_at REAL NOT NULL, views INTEGER NOT NULL, "
+    "likes INTEGER NOT NULL, comments INTEGER NOT NULL, favorites INTEGER NOT NULL, "
+    "PRIMARY KEY (video_id, fetched_at))",
+    "CREATE TABLE IF NOT EXISTS aliases "
+    "(alias TEXT PRIMARY KEY, channel_id TEXT NOT NULL, updated_at REAL NOT NULL)",
+)
+
+
+class ChannelSnapshotStore:
+    """
+    Local SQLite record of the videos seen per channel and timestamped snapshots of
+    their statistics, so repeat valuations only fetch uploads they have not seen.
+    It also indexes channel aliases (handles, usernames, search queries) by ID.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_SNAPSHOT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._aliases: Dict[str, str] = {}
+
+        if path:
+            try:
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._conn = self._connect(path)
+            except sqlite3.Error as e:
+                logger.warning(f"Snapshot store kept in memory, could not open {path}: {e}")
+        if self._conn is None:
+            self._conn = self._connect(":memory:")
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        for statement in _SCHEMA:
+            conn.execute(statement)
+
+        # Stores written before durations were kept in seconds
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(videos)")}
+        if "duration_seconds" not in columns:
+            conn.execute(
+                "ALTER TABLE videos ADD COLUMN duration_seconds INTEGER NOT NULL DEFAULT 0"
+            )
+            conn.executemany(
+                "UPDATE videos SET duration_seconds = ? WHERE video_id = ?",
+                [
+                    (_duration_seconds(duration), video_id)
+                    for video_id, duration in conn.execute(
+                        "SELECT video_id, duration FROM videos"
+                    ).fetchall()
+                ],
+            )
+        conn.commit()
+        return conn
+
+    def uploads_playlist_id(self, channel_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT uploads_playlist_id FROM channels WHERE channel_id = ?",
+                (channel_id,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_uploads_playlist_id(self, channel_id: str, playlist_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO channels (channel_id, uploads_playlist_id, updated_at) "
+                "VALUES (?, ?, ?)",
+                (channel_id, playlist_id, time.time()),
+            )
+            self._conn.commit()
+
+    def channel_for_alias(self, alias: str) -> Optional[str]:
+        """
+        Channel ID recorded for an alias such as `handle:mkbhd`, if any.
+        """
+        channel_id = self._aliases.get(alias)
+        if channel_id is None:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT channel_id FROM aliases WHERE alias = ?", (alias,)
+                ).fetchone()
+            if row is not None:
+                channel_id = self._aliases[alias] = row[0]
+        return channel_id
+
+    def set_aliases(self, channel_id: str, aliases: Iterable[str]) -> None:
+        rows = [(alias, channel_id, time.time()) for alias in aliases]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO aliases (alias, channel_id, updated_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+            for alias, _, _ in rows:
+                self._aliases[alias] = channel_id
+
+    def known_video_ids(self, channel_id: str) -> Set[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT video_id FROM videos WHERE channel_id = ?", (channel_id,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def videos(self, channel_id: str) -> List[Dict]:
+        """
+        Stored videos of a channel with their publish date and duration, newest first.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT video_id, published_at, duration, duration_seconds FROM videos "
+                "WHERE channel_id = ? ORDER BY published_at DESC",
+                (channel_id,),
+            ).fetchall()
+        return [
+            {
+                "videoId": row[0],
+                "publishedAt": row[1],
+                "duration": row[2],
+                "durationSeconds": row[3],
+            }
+            for row in rows
+        ]
+
+    def record(
+        self, channel_id: str, items: Iterable[Dict], fetched_at: Optional[float] = None
+    ) -> None:
+        """
+        Store `videos().list(part="snippet,contentDetails,statistics")` items and a
+        statistics snapshot for each of them taken at `fetched_at`.
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        videos, stats = [], []
+        for item in items:
+            statistics = item.get("statistics", {})
+            duration = item.get("contentDetails", {}).get("duration", "PT0S")
+            videos.append(
+                (
+                    item["id"],
+                    channel_id,
+                    item["snippet"]["publishedAt"],
+                    duration,
+                    _duration_seconds(duration),
+                )
+            )
+            stats.append(
+                (
+                    item["id"],
+                    fetched_at,
+                    int(statistics.get("viewCount", 0)),
+                    int(statistics.get("likeCount", 0)),
+                    int(statistics.get("commentCount", 0)),
+                    int(statistics.get("favoriteCount", 0)),
+                )
+            )
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO videos "
+                "(video_id, channel_id, published_at, duration, duration_seconds) "
+                "VALUES (?, ?, ?, ?, ?)",
+                videos,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO stats "
+                "(video_id, fetched_at, views, likes, comments, favorites) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                stats,
+            )
+            self._conn.commit()
+
+    def remove_videos(self, video_ids: Iterable[str]) -> None:
+        """
+        Forget videos that are gone from the channel (deleted or made private).
+        """
+        rows = [(video_id,) for video_id in video_ids]
+        with self._lock:
+            self._conn.executemany("DELETE FROM stats WHERE video_id = ?", rows)
+            self._conn.executemany("DELETE FROM videos WHERE video_id = ?", rows)
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            for table in ("stats", "videos", "channels", "aliases"):
+                self._conn.execute(f"DELETE FROM {table}")
+            self._conn.commit()
+            self._aliases.clear()
+
+    def view_history(self, video_id: str) -> List[Dict]:
+        """
+        Every recorded statistics snapshot of a video, oldest first.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fetched_at, views, likes, comments FROM stats "
+                "WHERE video_id = ? ORDER BY fetched_at",
+                (video_id,),
+            ).fetchall()
+        return [
+            {"fetchedAt": row[0], "viewCount": row[1], "likeCount": row[2], "commentCount": row[3]}
+            for row in rows
+        ]
+
+    def channel_history(self, channel_id: str) -> Dict[str, List[Dict]]:
+        """
+        View-count history of every stored video of a channel, keyed by video ID.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT s.video_id, s.fetched_at, s.views FROM stats s "
+                "JOIN videos v ON v.video_id = s.video_id "
+                "WHERE v.channel_id = ? ORDER BY s.video_id, s.fetched_at",
+                (channel_id,),
+            ).fetchall()
+        history: Dict[str, List[Dict]] = {}
+        for video_id, fetched_at, views in rows:
+            history.setdefault(video_id, []).append(
+                {"fetchedAt": fetched_at, "viewCount": views}
+            )
+        return history
+
+
+# Shared store; set YOUTUBE_SNAPSHOT_PATH="" to keep snapshots in memory only
+snapshot_store = ChannelSnapshotStore(
+    os.getenv("YOUTUBE_SNAPSHOT_PATH", DEFAULT_SNAPSHOT_PATH)
+)
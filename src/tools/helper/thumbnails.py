@@ -0,0 +1,257 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import requests
+
+from .tracing import trace_span
+
+if TYPE_CHECKING:
+    import torch
+    from PIL import Image
+    from transformers import CLIPModel, CLIPProcessor
+
+logger = logging.getLogger(__name__)
+
+# CLIP model and processor, loaded on first use by _get_clip()
+CLIP_MODEL_NAME = "openai/clip-vit-large-patch14"
+_clip: Optional[Tuple["CLIPModel", "CLIPProcessor"]] = None
+_clip_lock = threading.Lock()
+
+# Global parameters for thumbnail analysis
+TEMPERATURE = 0.07
+SCALE = 5.0
+
+# Prompts covering design, clarity, emotion, composition
+POSITIVE_PROMPTS = [
+    "eye-catching thumbnail",
+    "bold, vibrant colors",
+    "clear, readable text",
+    "prominent faces",
+    "professional design",
+]
+NEGATIVE_PROMPTS = [
+    "blurry or out of focus",
+    "dark or underexposed",
+    "dull colors",
+    "small or unreadable text",
+    "cluttered layout",
+]
+
+# Precomputed text features for the prompts above, persisted under CLIP_CACHE_DIR
+CLIP_CACHE_DIR = os.getenv("CLIP_CACHE_DIR", os.path.join(".cache", "clip"))
+_text_features: Optional["torch.Tensor"] = None
+_text_features_lock = threading.Lock()
+
+
+def _download_image(url: str) -> "Image.Image":
+    from PIL import Image
+
+    resp = requests.get(url, timeout=5)
+    resp.raise_for_status()
+    return Image.open(BytesIO(resp.content)).convert("RGB")
+
+
+def _get_clip() -> Tuple["CLIPModel", "CLIPProcessor"]:
+    """
+    Load the CLIP model and processor on first use; later calls return the same pair.
+    """
+    global _clip
+    if _clip is not None:
+        return _clip
+
+    with _clip_lock:
+        if _clip is None:
+            from transformers import CLIPModel, CLIPProcessor
+
+            logger.info(f"Loading CLIP model {CLIP_MODEL_NAME}…")
+            with trace_span("clip.load", "model", model=CLIP_MODEL_NAME):
+                model = CLIPModel.from_pretrained(CLIP_MODEL_NAME)
+                model.eval()
+                processor = CLIPProcessor.from_pretrained(CLIP_MODEL_NAME)
+            _clip = (model, processor)
+    return _clip
+
+
+def _warm_up_clip() -> threading.Thread:
+    """
+    Load CLIP and the prompt features in a background thread so the first
+    thumbnail request does not pay for it.
+    """
+
+    def warm_up():
+        _get_clip()
+        _get_text_features()
+
+    thread = threading.Thread(target=warm_up, name="clip-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def _text_features_path(texts: List[str]) -> str:
+    prompt_hash = hashlib.sha1(json.dumps(texts).encode("utf-8")).hexdigest()[:16]
+    model_slug = CLIP_MODEL_NAME.replace("/", "__")
+    return os.path.join(CLIP_CACHE_DIR, f"{model_slug}-{prompt_hash}.pt")
+
+
+def _save_text_features(feats: "torch.Tensor", path: str) -> None:
+    """
+    Persist text features atomically: write a temp file in the cache directory and
+    rename it into place, so readers never see a partly written file.
+    """
+    import torch
+
+    tmp_path = None
+    try:
+        os.makedirs(CLIP_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CLIP_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            torch.save(feats, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not persist CLIP text features: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _get_text_features() -> "torch.Tensor":
+    """
+    Normalized CLIP text features for `POSITIVE_PROMPTS + NEGATIVE_PROMPTS`, shape
+    (N_prompts, D). The prompts never change, so they are encoded once and persisted
+    to disk keyed by model name and prompt hash.
+    """
+    global _text_features
+    if _text_features is not None:
+        return _text_features
+
+    with _text_features_lock:
+        if _text_features is not None:
+            return _text_features
+
+        import torch
+
+        texts = POSITIVE_PROMPTS + NEGATIVE_PROMPTS
+        path = _text_features_path(texts)
+        try:
+            feats = torch.load(path)
+            if feats.shape[0] != len(texts):
+                raise ValueError(f"expected {len(texts)} rows, got {feats.shape[0]}")
+            logger.info(f"Loaded cached CLIP text features from {path}")
+        except FileNotFoundError:
+            feats = None
+        except Exception as e:
+            # A truncated or foreign file is just a cache miss; it is overwritten below
+            logger.warning(f"Ignoring unreadable CLIP text features at {path}: {e}")
+            feats = None
+
+        if feats is None:
+            model, processor = _get_clip()
+            inputs = processor(text=texts, return_tensors="pt", padding=True)
+            with torch.no_grad():
+                feats = model.get_text_features(
+                    input_ids=inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
+                )
+            feats = feats / feats.norm(dim=-1, keepdim=True)
+            _save_text_features(feats, path)
+
+        _text_features = feats
+        return _text_features
+
+
+def _scores_from_pixel_values(pixel_values: "torch.Tensor") -> "torch.Tensor":
+    """
+    Score a batch of preprocessed images, shape (B, 3, H, W) -> (B,) in [0, 1].
+    """
+    import torch
+
+    model, _ = _get_clip()
+
+    # Get and normalize image features; text features are precomputed
+    with trace_span("clip.forward", "model", batch_size=int(pixel_values.shape[0])):
+        with torch.no_grad():
+            img_feats = model.get_image_features(pixel_values)
+    img_feats = img_feats / img_feats.norm(dim=-1, keepdim=True)
+    txt_feats = _get_text_features()
+
+    # similarity logits
+    logits = (img_feats @ txt_feats.T) / TEMPERATURE  # shape (B, N_prompts)
+
+    # Debug: log a few values
+    for p, score in zip(POSITIVE_PROMPTS + NEGATIVE_PROMPTS, logits[0].tolist()):
+        logger.debug(f"  '{p}': {score:.3f}")
+
+    n_pos = len(POSITIVE_PROMPTS)
+    pos_mean = logits[:, :n_pos].mean(dim=1)
+    neg_mean = logits[:, n_pos:].mean(dim=1)
+    diff = pos_mean - neg_mean
+
+    # sigmoid normalization
+    return torch.sigmoid(diff * SCALE)
+
+
+def _score_thumbnail(thumbnail_url: str) -> float:
+    """
+    Compute a 0–1 score for how "attractive" a thumbnail is.
+    """
+    try:
+        logger.info(f"Scoring thumbnail: {thumbnail_url}")
+        img = _download_image(thumbnail_url)
+
+        _, processor = _get_clip()
+        inputs = processor(images=img, return_tensors="pt")
+
+        score = _scores_from_pixel_values(inputs["pixel_values"])[0].item()
+        logger.info(f"Thumbnail score → {score:.4f}")
+        return float(score)
+
+    except Exception as e:
+        logger.error(f"Failed to score thumbnail: {e}")
+        raise Exception(f"Failed to score thumbnail: {str(e)}")
+
+
+def _score_thumbnails(
+    thumbnail_urls: List[str], batch_size: int = 16, max_workers: int = 8
+) -> List[Dict]:
+    """
+    Score many thumbnails at once. Images are downloaded concurrently and encoded
+    in batches of `batch_size`, one forward pass per batch.
+
+    Returns one dict per URL, in input order: `{"url", "score"}` on success or
+    `{"url", "error"}` if the image could not be downloaded or scored.
+    """
+    results: List[Dict] = [{"url": url} for url in thumbnail_urls]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_download_image, url) for url in thumbnail_urls]
+
+    images: List[Tuple[int, "Image.Image"]] = []
+    for i, future in enumerate(futures):
+        try:
+            images.append((i, future.result()))
+        except Exception as e:
+            results[i]["error"] = f"Failed to download thumbnail: {str(e)}"
+
+    if images:
+        _, processor = _get_clip()
+
+    for start in range(0, len(images), batch_size):
+        batch = images[start : start + batch_size]
+        try:
+            inputs = processor(images=[img for _, img in batch], return_tensors="pt")
+            scores = _scores_from_pixel_values(inputs["pixel_values"]).tolist()
+        except Exception as e:
+            logger.error(f"Failed to score thumbnail batch: {e}")
+            for i, _ in batch:
+                results[i]["error"] = f"Failed to score thumbnail: {str(e)}"
+            continue
+        for (i, _), score in zip(batch, scores):
+            results[i]["score"] = float(score)
+
+    return results
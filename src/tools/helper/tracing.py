@@ -0,0 +1,373 @@
+import atexit
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Finished spans are appended here when set; TRACE_EXPORT_FORMAT is "jsonl" or "otlp"
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH")
+TRACE_EXPORT_FORMAT = os.getenv("TRACE_EXPORT_FORMAT", "jsonl")
+
+SERVICE_NAME = "valuatorai"
+
+# OpenTelemetry SpanKind values used in OTLP files
+_OTLP_KINDS = {"api": 3, "llm": 3}  # CLIENT; everything else INTERNAL (1)
+
+
+class Span:
+    """
+    One timed operation: a YouTube API call, LLM call, tool invocation or model
+    forward pass. `attributes` carry details such as quota units and cache hits.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        trace_id: str,
+        parent_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        start_ns: Optional[int] = None,
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.start_ns = time.time_ns() if start_ns is None else start_ns
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        end_ns = time.time_ns() if self.end_ns is None else self.end_ns
+        return (end_ns - self.start_ns) / 1e9
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def finish(self, error: Optional[BaseException] = None, end_ns: Optional[int] = None) -> None:
+        self.end_ns = time.time_ns() if end_ns is None else end_ns
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationSeconds": self.duration,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def to_otlp(self) -> Dict:
+        """
+        The span as an OTLP/JSON `resourceSpans` envelope, one per line of an OTLP file.
+        """
+
+        def value(v: Any) -> Dict:
+            if isinstance(v, bool):
+                return {"boolValue": v}
+            if isinstance(v, int):
+                return {"intValue": str(v)}
+            if isinstance(v, float):
+                return {"doubleValue": v}
+            return {"stringValue": str(v)}
+
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _OTLP_KINDS.get(self.kind, 1),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": value(v)}
+                for key, v in {"span.kind": self.kind, **self.attributes}.items()
+                if v is not None
+            ],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": SERVICE_NAME}}
+                        ]
+                    },
+                    "scopeSpans": [{"scope": {"name": __name__}, "spans": [span]}],
+                }
+            ]
+        }
+
+
+class SpanCollector:
+    """
+    Finished spans of one request, e.g. a single valuation in the UI.
+    """
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self) -> List[Dict]:
+        """
+        Per-stage totals (count, seconds, quota units, cache hits and misses), slowest
+        first. Concurrent spans overlap, so totals can exceed the wall-clock time.
+        """
+        stages: Dict = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            stage = stages.setdefault(
+                (span.kind, span.name),
+                {
+                    "kind": span.kind,
+                    "name": span.name,
+                    "count": 0,
+                    "seconds": 0.0,
+                    "quotaUnits": 0,
+                    "cacheHits": 0,
+                    "cacheMisses": 0,
+                    "errors": 0,
+                },
+            )
+            stage["count"] += 1
+            stage["seconds"] += span.duration
+            stage["quotaUnits"] += span.attributes.get("quota_units") or 0
+            stage["cacheHits"] += span.attributes.get("cache") in ("hit", "stale")
+            stage["cacheMisses"] += span.attributes.get("cache") == "miss"
+            stage["errors"] += span.error is not None
+        return sorted(stages.values(), key=lambda s: s["seconds"], reverse=True)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+_current_collector: ContextVar[Optional[SpanCollector]] = ContextVar(
+    "trace_collector", default=None
+)
+_export_lock = threading.Lock()
+
+
+def export_spans(spans: List[Span], path: str, format: str = "jsonl") -> None:
+    """
+    Append spans to `path` as JSON lines, either plain (`jsonl`) or as OTLP/JSON
+    envelopes (`otlp`) that OpenTelemetry collectors can ingest.
+    """
+    lines = [
+        json.dumps(span.to_otlp() if format == "otlp" else span.to_dict(), default=str)
+        for span in spans
+    ]
+    with _export_lock:
+        with open(path, "a", encoding="utf-8") as f:
+            for line in lines:
+                f.write(line + "\n")
+
+
+class SpanExporter:
+    """
+    Appends finished spans to an export file from a background thread, so the
+    request path only enqueues them. Spans queued while a batch is written are
+    written together in the next one.
+    """
+
+    def __init__(self, path: str, format: str = "jsonl"):
+        self.path = path
+        self.format = format
+        self._queue: "queue.SimpleQueue[Union[Span, threading.Event, None]]" = (
+            queue.SimpleQueue()
+        )
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, span: Span) -> None:
+        self._queue.put(span)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until every span submitted so far has been written.
+        """
+        written = threading.Event()
+        self._queue.put(written)
+        written.wait(timeout)
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(5)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            spans = [item for item in batch if isinstance(item, Span)]
+            if spans:
+                try:
+                    export_spans(spans, self.path, self.format)
+                except OSError as e:
+                    logger.warning(f"Could not export {len(spans)} spans to {self.path}: {e}")
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if None in batch:
+                return
+
+
+_exporter: Optional[SpanExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def _get_exporter() -> SpanExporter:
+    global _exporter
+    with _exporter_lock:
+        if _exporter is None:
+            _exporter = SpanExporter(TRACE_EXPORT_PATH, TRACE_EXPORT_FORMAT)
+        return _exporter
+
+
+def flush_spans(timeout: Optional[float] = None) -> None:
+    """
+    Wait until spans queued for `TRACE_EXPORT_PATH` have been written.
+    """
+    if _exporter is not None:
+        _exporter.flush(timeout)
+
+
+def _record(span: Span) -> None:
+    collector = _current_collector.get()
+    if collector is not None:
+        collector.add(span)
+    if TRACE_EXPORT_PATH:
+        _get_exporter().submit(span)
+
+
+def _new_span(name: str, kind: str, attributes: Dict, start_ns: Optional[int] = None) -> Span:
+    parent = _current_span.get()
+    return Span(
+        name,
+        kind,
+        parent.trace_id if parent else secrets.token_hex(16),
+        parent.span_id if parent else None,
+        attributes,
+        start_ns,
+    )
+
+
+@contextmanager
+def trace_span(name: str, kind: str = "internal", **attributes: Any) -> Iterator[Span]:
+    """
+    Time the enclosed block as a child of the current span. Works in sync and
+    async code alike since the parent is tracked in a context variable.
+    """
+    span = _new_span(name, kind, attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.finish(e)
+        raise
+    else:
+        span.finish()
+    finally:
+        _current_span.reset(token)
+        _record(span)
+
+
+def record_span(
+    name: str, kind: str, start_ns: int, end_ns: int, **attributes: Any
+) -> Span:
+    """
+    Record an operation timed elsewhere, e.g. from framework instrumentation events.
+    """
+    span = _new_span(name, kind, attributes, start_ns)
+    span.finish(end_ns=end_ns)
+    _record(span)
+    return span
+
+
+def current_span() -> Optional[Span]:
+    """
+    The innermost open span in this context, if any.
+    """
+    return _current_span.get()
+
+
+def annotate(**attributes: Any) -> None:
+    """
+    Add attributes to the current span, if any.
+    """
+    span = _current_span.get()
+    if span is not None:
+        span.set(**attributes)
+
+
+def traced(kind: str, name: Optional[str] = None) -> Callable:
+    """
+    Decorator that runs every call of a sync or async function in a span.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__name__
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with trace_span(span_name, kind):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with trace_span(span_name, kind):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def collect_spans() -> Iterator[SpanCollector]:
+    """
+    Collect every span finished inside the block (including in tasks it starts).
+    """
+    collector = SpanCollector()
+    token = _current_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_collector.reset(token)
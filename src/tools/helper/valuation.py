@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, Iterable, Optional
+
+from .quota import BULK, QuotaBudget, use_quota_budget, use_request_priority
+from .youtube import _fetch_video_stats_frame, _resolve_channel_id
+
+logger = logging.getLogger(__name__)
+
+
+async def _valuate_channel(
+    identifier: str,
+    target_cpm: float,
+    currency: str = "EUR",
+    confidence_level: float = 0.90,
+    max_results: int = 10,
+    months: int = 6,
+    min_duration_minutes: int = 3,
+    half_life_days: Optional[float] = None,
+) -> Dict:
+    """
+    Deterministic valuation pipeline: resolve the channel, fetch recent video
+    statistics and compute median views, the CPM-based price, a log-normal
+    interval for the next video's views and a bootstrap interval of the median
+    whose lower bound gives a conservative price, all in-process.
+
+    With `half_life_days`, uploads are weighted by exp. recency so a video that
+    much older than the newest upload counts half as much.
+    """
+    if target_cpm <= 0:
+        raise ValueError("Target CPM must be positive")
+    if half_life_days is not None and not half_life_days > 0:
+        raise ValueError("Half-life days must be positive")
+
+    channel_id = await _resolve_channel_id(identifier)
+    frame = await _fetch_video_stats_frame(
+        channel_id, max_results, months, min_duration_minutes
+    )
+    if not len(frame):
+        raise ValueError(f"No qualifying videos found for channel: {identifier}")
+
+    price_per_view = target_cpm / 1000
+
+    # The log-normal fit needs at least two positive view counts
+    interval = frame.view_interval(confidence_level, "two-sided", half_life_days)
+    view_interval = {"lower": None, "upper": None}
+    price_interval = {"lower": None, "upper": None}
+    if interval is not None:
+        lower, upper = interval
+        view_interval = {"lower": lower, "upper": upper}
+        price_interval = {
+            "lower": round(price_per_view * lower, 2),
+            "upper": round(price_per_view * upper, 2),
+        }
+
+    median_lower, median_upper = frame.median_interval(
+        confidence_level, "two-sided", half_life_days
+    )
+
+    return {
+        "channelId": channel_id,
+        "identifier": identifier,
+        "currency": currency,
+        "targetCpm": target_cpm,
+        "videoCount": len(frame),
+        "viewCounts": frame.views.tolist(),
+        "medianViews": frame.median_views(half_life_days),
+        "recommendedPrice": frame.price(target_cpm, half_life_days),
+        "conservativePrice": round(price_per_view * median_lower, 2),
+        "confidenceLevel": confidence_level,
+        "halfLifeDays": half_life_days,
+        "medianViewsInterval": {"lower": median_lower, "upper": median_upper},
+        "viewInterval": view_interval,
+        "priceInterval": price_interval,
+    }
+
+
+async def _valuate_channels(
+    rows: Iterable[Dict],
+    concurrency: int = 8,
+    quota_limit: Optional[int] = None,
+) -> AsyncIterator[Dict]:
+    """
+    Value many channels concurrently and yield one result per row as soon as it
+    completes (not in input order).
+
+    Each row needs `identifier` and `target_cpm`, and may set `currency`.
+    At most `concurrency` valuations run at once and all of them share a quota
+    budget of `quota_limit` units and are scheduled as bulk work, behind
+    interactive requests. A failing row yields
+    `{"row", "identifier", "status": "error", "error"}` and the run continues.
+    """
+    budget = QuotaBudget(quota_limit)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(index: int, row: Dict) -> Dict:
+        async with semaphore:
+            use_quota_budget(budget)
+            use_request_priority(BULK)
+            identifier = row.get("identifier")
+            try:
+                valuation = await _valuate_channel(
+                    identifier, float(row["target_cpm"]), row.get("currency") or "EUR"
+                )
+                return {
+                    "row": index,
+                    "identifier": identifier,
+                    "status": "ok",
+                    "valuation": valuation,
+                }
+            except Exception as e:
+                logger.warning(f"Valuation failed for row {index} ({identifier}): {e}")
+                return {
+                    "row": index,
+                    "identifier": identifier,
+                    "status": "error",
+                    "error": str(e),
+                }
+
+    tasks = [asyncio.create_task(run(i, row)) for i, row in enumerate(rows)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        logger.info(f"Bulk valuation used {budget.used} quota units")
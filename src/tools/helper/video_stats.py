@@ -0,0 +1,214 @@
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple
+
+import numpy as np
+
+from .durations import _duration_seconds
+from .forecast import (
+    _bootstrap_median_interval_batch,
+    _predict_next_video_views_batch,
+    _recency_weights,
+    _weighted_median,
+)
+
+
+def _epoch_seconds(timestamp: Optional[str]) -> int:
+    if not timestamp:
+        return 0
+    return int(datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp())
+
+
+class VideoStats:
+    """
+    The numbers pricing needs from one video, without its description, title or
+    thumbnails.
+    """
+
+    __slots__ = (
+        "video_id",
+        "view_count",
+        "like_count",
+        "comment_count",
+        "duration_seconds",
+        "published_at",
+    )
+
+    def __init__(
+        self,
+        video_id: str,
+        view_count: int,
+        like_count: int,
+        comment_count: int,
+        duration_seconds: int,
+        published_at: int,
+    ):
+        self.video_id = video_id
+        self.view_count = view_count
+        self.like_count = like_count
+        self.comment_count = comment_count
+        self.duration_seconds = duration_seconds
+        self.published_at = published_at  # seconds since the epoch
+
+    @classmethod
+    def from_item(cls, video: Dict) -> "VideoStats":
+        """
+        Build from a `videos().list(part="statistics,contentDetails,snippet")` item.
+        """
+        stats = video.get("statistics", {})
+        return cls(
+            video["id"],
+            int(stats.get("viewCount", 0)),
+            int(stats.get("likeCount", 0)),
+            int(stats.get("commentCount", 0)),
+            _duration_seconds(video.get("contentDetails", {}).get("duration", "PT0S")),
+            _epoch_seconds(video.get("snippet", {}).get("publishedAt")),
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "videoId": self.video_id,
+            "viewCount": self.view_count,
+            "likeCount": self.like_count,
+            "commentCount": self.comment_count,
+            "durationSeconds": self.duration_seconds,
+            "publishedAt": datetime.utcfromtimestamp(self.published_at).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            ),
+        }
+
+    def __repr__(self) -> str:
+        return f"VideoStats({self.video_id!r}, views={self.view_count})"
+
+
+class VideoStatsFrame:
+    """
+    Statistics of many videos in columnar form: row `i` of every array belongs to
+    `video_ids[i]`. Pricing runs directly on the arrays.
+    """
+
+    def __init__(
+        self,
+        video_ids: List[str],
+        views: np.ndarray,
+        likes: np.ndarray,
+        comments: np.ndarray,
+        duration: np.ndarray,
+        published_at: np.ndarray,
+    ):
+        self.video_ids = video_ids
+        self.views = views
+        self.likes = likes
+        self.comments = comments
+        self.duration = duration  # seconds
+        self.published_at = published_at  # seconds since the epoch
+
+    @classmethod
+    def from_records(cls, records: Iterable[VideoStats]) -> "VideoStatsFrame":
+        records = list(records)
+        return cls(
+            [r.video_id for r in records],
+            np.fromiter((r.view_count for r in records), np.int64, len(records)),
+            np.fromiter((r.like_count for r in records), np.int64, len(records)),
+            np.fromiter((r.comment_count for r in records), np.int64, len(records)),
+            np.fromiter((r.duration_seconds for r in records), np.int32, len(records)),
+            np.fromiter((r.published_at for r in records), np.int64, len(records)),
+        )
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict]) -> "VideoStatsFrame":
+        return cls.from_records(VideoStats.from_item(item) for item in items)
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+    def __iter__(self) -> Iterator[VideoStats]:
+        return self.records()
+
+    def records(self) -> Iterator[VideoStats]:
+        for i, video_id in enumerate(self.video_ids):
+            yield VideoStats(
+                video_id,
+                int(self.views[i]),
+                int(self.likes[i]),
+                int(self.comments[i]),
+                int(self.duration[i]),
+                int(self.published_at[i]),
+            )
+
+    def to_dicts(self) -> List[Dict]:
+        return [record.to_dict() for record in self.records()]
+
+    def select(self, mask: np.ndarray) -> "VideoStatsFrame":
+        """
+        Rows where the boolean `mask` is set, e.g. `frame.select(frame.duration >= 180)`.
+        """
+        indices = np.flatnonzero(mask)
+        return VideoStatsFrame(
+            [self.video_ids[i] for i in indices],
+            self.views[indices],
+            self.likes[indices],
+            self.comments[indices],
+            self.duration[indices],
+            self.published_at[indices],
+        )
+
+    def recency_weights(self, half_life_days: Optional[float]) -> Optional[np.ndarray]:
+        return _recency_weights(self.published_at, half_life_days)
+
+    def median_views(self, half_life_days: Optional[float] = None) -> float:
+        """
+        Median views, weighted towards recent uploads when `half_life_days` is set.
+        """
+        if not len(self):
+            return 0.0
+        return float(
+            _weighted_median(self.views.astype(float), self.recency_weights(half_life_days))
+        )
+
+    def price(self, target_cpm: float, half_life_days: Optional[float] = None) -> float:
+        """
+        CPM price of the median video.
+        """
+        return round(target_cpm / 1000 * self.median_views(half_life_days), 2)
+
+    def view_interval(
+        self,
+        confidence_level: float = 0.90,
+        interval_type: Literal["lower", "upper", "two-sided"] = "two-sided",
+        half_life_days: Optional[float] = None,
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Log-normal interval for the next video's views, or None when fewer than two
+        videos have any views.
+        """
+        positive = self.views > 0
+        if positive.sum() < 2:
+            return None
+        weights = self.recency_weights(half_life_days)
+        lower, upper = _predict_next_video_views_batch(
+            [self.views[positive]],
+            confidence_level,
+            interval_type,
+            weights=None if weights is None else [weights[positive]],
+        )
+        return float(lower[0]), float(upper[0])
+
+    def median_interval(
+        self,
+        confidence_level: float = 0.90,
+        interval_type: Literal["lower", "upper", "two-sided"] = "two-sided",
+        half_life_days: Optional[float] = None,
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Bootstrap interval of the median views, or None for an empty frame.
+        """
+        if not len(self):
+            return None
+        weights = self.recency_weights(half_life_days)
+        lower, upper = _bootstrap_median_interval_batch(
+            self.views[None, :],
+            confidence_level,
+            interval_type,
+            None if weights is None else weights[None, :],
+        )
+        return float(lower[0]), float(upper[0])
@@ -0,0 +1,992 @@
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import httplib2
+import httpx
+from googleapiclient.errors import HttpError
+
+from .async_youtube import AsyncYouTubeClient, YouTubeAPIError, get_async_client
+from .cache import cache_key, response_cache, ttl_for
+from .durations import _duration_seconds
+from .quota import (
+    INTERACTIVE,
+    QUOTA_COSTS,
+    QuotaExceededError,
+    charge_quota,
+    charge_quota_async,
+    quota_scheduler,
+    request_priority,
+)
+from .resilience import (
+    HEDGE_AFTER,
+    CircuitOpenError,
+    call_with_retries,
+    call_with_retries_async,
+    is_transient,
+    unavailable_error,
+)
+from .snapshots import snapshot_store
+from .tracing import trace_span
+from .video_stats import VideoStats, VideoStatsFrame
+
+logger = logging.getLogger(__name__)
+
+
+class YouTubeAPI:
+    """
+    Holds the YouTube API clients. The API key is checked and the discovery client
+    is built on first use, so importing this module never touches the network.
+    """
+
+    def __init__(self):
+        self._youtube = None
+        self._lock = threading.Lock()
+        self.ydl_opts = {"quiet": True, "no_warnings": True, "extract_flat": True}
+
+    @property
+    def api_key(self) -> str:
+        api_key = os.getenv("YOUTUBE_API_KEY")
+        if not api_key:
+            raise ValueError("YouTube API key not found in environment variables")
+        return api_key
+
+    @property
+    def youtube(self):
+        if self._youtube is None:
+            with self._lock:
+                if self._youtube is None:
+                    from googleapiclient.discovery import build
+
+                    self._youtube = build("youtube", "v3", developerKey=self.api_key)
+        return self._youtube
+
+    @property
+    def aio(self) -> AsyncYouTubeClient:
+        """
+        Pooled asyncio client bound to the running event loop.
+        """
+        return get_async_client(self.api_key)
+
+
+# Create a singleton instance
+youtube_api = YouTubeAPI()
+
+# `videos().list` and `channels().list` accept at most 50 comma-separated IDs
+MAX_IDS_PER_REQUEST = 50
+
+
+def _stale_response(resource: str, key: str, span, reason: str) -> Optional[Dict]:
+    stale = response_cache.get_stale(key)
+    if stale is not None:
+        logger.info(f"Serving stale {resource} response: {reason}")
+        span.set(cache="stale", quota_units=0)
+    return stale
+
+
+def _is_quota_error(error: Exception) -> bool:
+    if isinstance(error, HttpError):
+        status, message = error.resp.status, str(error)
+    else:
+        status, message = error.status_code, error.reason
+    return status == 403 and "quota" in message.lower()
+
+
+def _youtube_list(resource: str, part: str, **params) -> Dict:
+    """
+    Execute `youtube.<resource>().list(part=..., **params)`, serving fresh responses
+    from the shared response cache instead of the network.
+
+    Every request sent, retries included, is charged to the daily quota scheduler.
+    Transient failures are retried with backoff behind a per-endpoint circuit
+    breaker. When quota runs low or out, the circuit is open or retries are used up,
+    an expired cached response is served if there is one; otherwise an open circuit
+    or network failure is raised as a 503 `HttpError`.
+    """
+    with trace_span(f"youtube.{resource}.list", "api", resource=resource, part=part) as span:
+        key = cache_key(resource, part, params)
+        cached = response_cache.get(key)
+        if cached is not None:
+            span.set(cache="hit", quota_units=0)
+            return cached
+
+        if quota_scheduler.conserving:
+            stale = _stale_response(resource, key, span, "daily quota running low")
+            if stale is not None:
+                return stale
+
+        span.set(cache="miss", quota_units=0)
+
+        def send() -> Dict:
+            span.set(quota_units=span.attributes["quota_units"] + charge_quota(resource))
+            request = getattr(youtube_api.youtube, resource)().list(part=part, **params)
+            return request.execute()
+
+        try:
+            response = call_with_retries(resource, send)
+        except (
+            QuotaExceededError,
+            CircuitOpenError,
+            HttpError,
+            OSError,
+            httplib2.HttpLib2Error,
+        ) as e:
+            if isinstance(e, HttpError):
+                if _is_quota_error(e):
+                    quota_scheduler.exhaust()
+                elif not is_transient(e):
+                    raise
+            stale = _stale_response(resource, key, span, str(e))
+            if stale is not None:
+                return stale
+            if isinstance(e, (QuotaExceededError, HttpError)):
+                raise
+            raise unavailable_error(resource, e) from e
+        response_cache.set(key, response, ttl_for(resource, part))
+        return response
+
+
+async def _youtube_list_async(resource: str, part: str, **params) -> Dict:
+    """
+    Async counterpart of `_youtube_list` that does not block the event loop.
+    Interactive calls to 1-unit endpoints are hedged when `YOUTUBE_HEDGE_AFTER`
+    is set: a duplicate request goes out if the first is slower than that.
+    """
+    with trace_span(f"youtube.{resource}.list", "api", resource=resource, part=part) as span:
+        key = cache_key(resource, part, params)
+        cached = response_cache.get(key)
+        if cached is not None:
+            span.set(cache="hit", quota_units=0)
+            return cached
+
+        if quota_scheduler.conserving:
+            stale = _stale_response(resource, key, span, "daily quota running low")
+            if stale is not None:
+                return stale
+
+        span.set(cache="miss", quota_units=0)
+
+        async def send() -> Dict:
+            units = await charge_quota_async(resource)
+            span.set(quota_units=span.attributes["quota_units"] + units)
+            return await youtube_api.aio.list(resource, part, **params)
+
+        hedge_after = None
+        if request_priority() == INTERACTIVE and QUOTA_COSTS.get(resource, 1) == 1:
+            hedge_after = HEDGE_AFTER
+        try:
+            response = await call_with_retries_async(resource, send, hedge_after)
+        except (
+            QuotaExceededError,
+            CircuitOpenError,
+            YouTubeAPIError,
+            httpx.TransportError,
+            OSError,
+        ) as e:
+            if isinstance(e, YouTubeAPIError):
+                if _is_quota_error(e):
+                    quota_scheduler.exhaust()
+                elif not is_transient(e):
+                    raise
+            stale = _stale_response(resource, key, span, str(e))
+            if stale is not None:
+                return stale
+            if isinstance(e, (QuotaExceededError, YouTubeAPIError)):
+                raise
+            raise unavailable_error(resource, e, asynchronous=True) from e
+        response_cache.set(key, response, ttl_for(resource, part))
+        return response
+
+
+_CHANNEL_ID_RE = re.compile(r"^UC[a-zA-Z0-9_-]{22}$")
+_VIDEO_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{11}$")
+
+# First path segments of youtube.com URLs that are not legacy custom channel names
+_RESERVED_PATHS = {
+    "watch", "shorts", "live", "embed", "playlist", "results", "feed", "channel",
+    "user", "c", "v", "hashtag", "gaming", "premium", "account", "redirect",
+}
+
+
+def _normalize_alias(kind: str, value: str) -> str:
+    """
+    Index key for an identifier: handles, usernames and custom names are matched
+    case-insensitively, search queries ignoring case and repeated whitespace.
+    """
+    if kind == "video":
+        return f"video:{value}"
+    return f"{kind}:{' '.join(value.split()).lower()}"
+
+
+def _parse_channel_identifier(channel_identifier: str) -> Tuple[str, str]:
+    """
+    Classify a channel identifier without any API call.
+
+    Returns `(kind, value)` where kind is `id` (a `UC...` channel ID), `handle`,
+    `user` (legacy username), `custom` (legacy custom URL name), `video` (a video
+    whose channel is wanted) or `query` (free text to search for).
+    """
+    identifier = channel_identifier.strip()
+    if _CHANNEL_ID_RE.match(identifier):
+        return "id", identifier
+
+    lowered = identifier.lower()
+    is_url = (
+        lowered.startswith(("http://", "https://"))
+        or "youtube.com/" in lowered
+        or "youtu.be/" in lowered
+    )
+    if not is_url:
+        if identifier.startswith("@") and " " not in identifier:
+            return "handle", identifier[1:]
+        if not identifier:
+            raise ValueError("Channel identifier cannot be empty")
+        return "query", identifier
+
+    url = urlsplit(identifier if "://" in identifier else f"https://{identifier}")
+    host = (url.hostname or "").lower()
+    segments = [unquote(segment) for segment in url.path.split("/") if segment]
+
+    if host == "youtu.be" and segments:
+        return "video", segments[0]
+    if not (host == "youtube.com" or host.endswith(".youtube.com")):
+        raise ValueError(f"Not a YouTube URL: {channel_identifier}")
+
+    if segments:
+        head = segments[0]
+        rest = segments[1] if len(segments) > 1 else None
+        if head.startswith("@"):
+            return "handle", head[1:]
+        if head == "channel" and rest and _CHANNEL_ID_RE.match(rest):
+            return "id", rest
+        if head == "user" and rest:
+            return "user", rest
+        if head == "c" and rest:
+            return "custom", rest
+        if head in ("shorts", "live", "embed", "v") and rest and _VIDEO_ID_RE.match(rest):
+            return "video", rest
+        if head == "watch":
+            video_id = parse_qs(url.query).get("v", [""])[0]
+            if _VIDEO_ID_RE.match(video_id):
+                return "video", video_id
+        if head not in _RESERVED_PATHS and len(segments) == 1:
+            return "custom", head
+
+    raise ValueError(f"Unsupported YouTube URL: {channel_identifier}")
+
+
+def _remember_channel_handles(items: Iterable[Dict]) -> None:
+    """
+    Index the handle (`snippet.customUrl`) of every channel item that carries one.
+    """
+    for item in items:
+        custom_url = item.get("snippet", {}).get("customUrl")
+        if custom_url:
+            kind = "handle" if custom_url.startswith("@") else "custom"
+            alias = _normalize_alias(kind, custom_url.lstrip("@"))
+            if snapshot_store.channel_for_alias(alias) != item["id"]:
+                snapshot_store.set_aliases(item["id"], [alias])
+
+
+async def _resolve_channel_id(channel_identifier: str) -> str:
+    """
+    Resolve any channel ID, handle, channel/user/custom/video URL or channel name
+    to a channel ID.
+
+    IDs and `/channel/UC...` URLs are parsed locally and every resolution is kept
+    in a persistent alias index, so repeats cost no quota. New handles, usernames
+    and videos take one 1-unit lookup; only free-text names and unknown custom URLs
+    fall back to a 100-unit search.
+    """
+    kind, value = _parse_channel_identifier(channel_identifier)
+    if kind == "id":
+        return value
+
+    alias = _normalize_alias(kind, value)
+    channel_id = snapshot_store.channel_for_alias(alias)
+    if channel_id is not None:
+        return channel_id
+
+    try:
+        if kind == "video":
+            response = await _youtube_list_async("videos", part="snippet", id=value)
+            items = response.get("items", [])
+            channel_id = items[0]["snippet"]["channelId"] if items else None
+        elif kind == "user":
+            response = await _youtube_list_async("channels", part="id", forUsername=value)
+            items = response.get("items", [])
+            channel_id = items[0]["id"] if items else None
+        elif kind in ("handle", "custom"):
+            # Most legacy custom URLs live on as the channel's handle
+            response = await _youtube_list_async("channels", part="id", forHandle=value)
+            items = response.get("items", [])
+            channel_id = items[0]["id"] if items else None
+
+        if channel_id is None and kind in ("custom", "query"):
+            response = await _youtube_list_async(
+                "search", part="snippet", q=value, type="channel", maxResults=1
+            )
+            items = response.get("items", [])
+            channel_id = items[0]["id"]["channelId"] if items else None
+    except YouTubeAPIError as e:
+        raise Exception(f"Error resolving channel ID: {str(e)}")
+
+    if channel_id is None:
+        raise ValueError(f"Channel not found: {channel_identifier}")
+
+    snapshot_store.set_aliases(channel_id, [alias])
+    return channel_id
+
+
+def _chunked(items: List[str], size: int = MAX_IDS_PER_REQUEST) -> Iterator[List[str]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _fetch_video_items(video_ids: List[str], part: str) -> Dict[str, Dict]:
+    """
+    Fetch raw `videos().list` items for any number of video IDs, 50 IDs per request.
+    Returns a mapping of video ID -> API item; IDs the API did not return are absent.
+    """
+    items: Dict[str, Dict] = {}
+    unique_ids = list(dict.fromkeys(video_ids))
+    for chunk in _chunked(unique_ids):
+        response = _youtube_list(
+            "videos", part=part, id=",".join(chunk), maxResults=len(chunk)
+        )
+        for item in response.get("items", []):
+            items[item["id"]] = item
+    return items
+
+
+def _fetch_channel_items(channel_ids: List[str], part: str) -> Dict[str, Dict]:
+    """
+    Fetch raw `channels().list` items for any number of channel IDs, 50 IDs per request.
+    Returns a mapping of channel ID -> API item; IDs the API did not return are absent.
+    """
+    items: Dict[str, Dict] = {}
+    unique_ids = list(dict.fromkeys(channel_ids))
+    for chunk in _chunked(unique_ids):
+        response = _youtube_list(
+            "channels", part=part, id=",".join(chunk), maxResults=len(chunk)
+        )
+        for item in response.get("items", []):
+            items[item["id"]] = item
+    _remember_channel_handles(items.values())
+    return items
+
+
+async def _fetch_items_async(
+    resource: str,
+    ids: List[str],
+    part: str,
+    fetched_at: Optional[Dict[str, float]] = None,
+) -> Dict[str, Dict]:
+    """
+    Async `_fetch_video_items`/`_fetch_channel_items`: the 50-ID chunks are
+    requested concurrently. If a `fetched_at` dict is given, it is filled with the
+    time each item was actually fetched from the API, which for cached responses
+    is earlier than now.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    chunks = list(_chunked(unique_ids))
+    responses = await asyncio.gather(
+        *(
+            _youtube_list_async(
+                resource, part=part, id=",".join(chunk), maxResults=len(chunk)
+            )
+            for chunk in chunks
+        )
+    )
+    if fetched_at is not None:
+        now = time.time()
+        for chunk, response in zip(chunks, responses):
+            params = {"id": ",".join(chunk), "maxResults": len(chunk)}
+            when = response_cache.fetched_at(cache_key(resource, part, params)) or now
+            for item in response.get("items", []):
+                fetched_at[item["id"]] = when
+    return {
+        item["id"]: item
+        for response in responses
+        for item in response.get("items", [])
+    }
+
+
+async def _fetch_video_items_async(
+    video_ids: List[str], part: str, fetched_at: Optional[Dict[str, float]] = None
+) -> Dict[str, Dict]:
+    return await _fetch_items_async("videos", video_ids, part, fetched_at)
+
+
+def _record_snapshots(
+    channel_id: str, items: Dict[str, Dict], fetched_at: Dict[str, float]
+) -> None:
+    """
+    Record video items in the snapshot store at the time each was fetched, so a
+    cached response re-recorded later overwrites its own snapshot instead of adding
+    a stale point to the view history.
+    """
+    by_time: Dict[float, List[Dict]] = {}
+    for video_id, item in items.items():
+        by_time.setdefault(fetched_at.get(video_id, time.time()), []).append(item)
+    for when, group in by_time.items():
+        snapshot_store.record(channel_id, group, when)
+
+
+async def _fetch_channel_items_async(
+    channel_ids: List[str], part: str
+) -> Dict[str, Dict]:
+    items = await _fetch_items_async("channels", channel_ids, part)
+    _remember_channel_handles(items.values())
+    return items
+
+
+def _video_details_from_item(video: Dict) -> Dict:
+    stats = video.get("statistics", {})
+    return {
+        "id": video["id"],
+        "title": video["snippet"]["title"],
+        "description": video["snippet"]["description"],
+        "publishedAt": video["snippet"]["publishedAt"],
+        "viewCount": int(stats.get("viewCount", 0)),
+        "likeCount": int(stats.get("likeCount", 0)),
+        "commentCount": int(stats.get("commentCount", 0)),
+        "duration": video["contentDetails"]["duration"],
+        "durationSeconds": _duration_seconds(video["contentDetails"]["duration"]),
+        "thumbnails": video["snippet"]["thumbnails"],
+    }
+
+
+def _fetch_video_details_batch(
+    video_ids: List[str], lean: bool = False
+) -> Tuple[List[Dict], List[str]]:
+    """
+    Fetch details for any number of videos using batched `videos().list` calls.
+    With `lean`, only the statistics of `VideoStats` are returned, without the
+    title, description and thumbnails.
+
+    Returns:
+        Tuple[List[Dict], List[str]]: video details in the same order as `video_ids`,
+        and the IDs that the API did not return (deleted, private or invalid).
+    """
+    try:
+        items = _fetch_video_items(video_ids, "snippet,statistics,contentDetails")
+    except HttpError as e:
+        raise Exception(f"Error fetching video details: {str(e)}")
+
+    return _video_details_in_order(video_ids, items, lean)
+
+
+async def _fetch_video_details_batch_async(
+    video_ids: List[str], lean: bool = False
+) -> Tuple[List[Dict], List[str]]:
+    try:
+        items = await _fetch_video_items_async(
+            video_ids, "snippet,statistics,contentDetails"
+        )
+    except YouTubeAPIError as e:
+        raise Exception(f"Error fetching video details: {str(e)}")
+
+    return _video_details_in_order(video_ids, items, lean)
+
+
+def _video_details_in_order(
+    video_ids: List[str], items: Dict[str, Dict], lean: bool = False
+) -> Tuple[List[Dict], List[str]]:
+    videos: List[Dict] = []
+    missing: List[str] = []
+    for video_id in video_ids:
+        item = items.get(video_id)
+        if item is None:
+            missing.append(video_id)
+            continue
+        if lean:
+            videos.append(VideoStats.from_item(item).to_dict())
+        else:
+            videos.append(_video_details_from_item(item))
+
+    if missing:
+        logger.warning(f"Videos not found: {', '.join(missing)}")
+    return videos, missing
+
+
+def _fetch_video_details(video_id: str) -> Dict:
+    videos, missing = _fetch_video_details_batch([video_id])
+    if missing:
+        raise ValueError(f"Video not found: {video_id}")
+    return videos[0]
+
+
+async def _fetch_video_details_async(video_id: str) -> Dict:
+    videos, missing = await _fetch_video_details_batch_async([video_id])
+    if missing:
+        raise ValueError(f"Video not found: {video_id}")
+    return videos[0]
+
+
+def _search_youtube_channel_videos(
+    channel_id: str, search_term: str, max_results: int = 10
+) -> List[Dict]:
+    try:
+        # Search for videos in the channel
+        response = _youtube_list(
+            "search",
+            part="snippet",
+            channelId=channel_id,
+            q=search_term,
+            type="video",
+            maxResults=max_results,
+            order="relevance",
+        )
+
+        if not response["items"]:
+            return []
+
+        # Get detailed information for all videos in batched requests
+        video_ids = [item["id"]["videoId"] for item in response["items"]]
+        videos, _ = _fetch_video_details_batch(video_ids)
+
+        return videos
+
+    except HttpError as e:
+        raise Exception(f"Error searching channel videos: {str(e)}")
+
+
+def _channel_info_from_item(channel: Dict) -> Dict:
+    return {
+        "id": channel["id"],
+        "title": channel["snippet"]["title"],
+        "description": channel["snippet"]["description"],
+        "subscriberCount": int(channel["statistics"].get("subscriberCount", 0)),
+        "viewCount": int(channel["statistics"]["viewCount"]),
+        "videoCount": int(channel["statistics"]["videoCount"]),
+        "thumbnails": channel["snippet"]["thumbnails"],
+    }
+
+
+def _fetch_channel_info(channel_id: str) -> Dict:
+    try:
+        response = _youtube_list("channels", part="snippet,statistics", id=channel_id)
+
+        if not response["items"]:
+            raise ValueError(f"Channel not found: {channel_id}")
+
+        _remember_channel_handles(response["items"])
+        return _channel_info_from_item(response["items"][0])
+    except HttpError as e:
+        raise Exception(f"Error fetching channel info: {str(e)}")
+
+
+async def _fetch_channel_info_async(channel_id: str) -> Dict:
+    try:
+        response = await _youtube_list_async(
+            "channels", part="snippet,statistics", id=channel_id
+        )
+
+        if not response["items"]:
+            raise ValueError(f"Channel not found: {channel_id}")
+
+        _remember_channel_handles(response["items"])
+        return _channel_info_from_item(response["items"][0])
+    except YouTubeAPIError as e:
+        raise Exception(f"Error fetching channel info: {str(e)}")
+
+
+def _uploads_playlist_id(response: Dict, channel_id: str) -> str:
+    """
+    Extract the uploads playlist ID from a `channels().list(part="contentDetails")` response.
+    """
+    if not response["items"]:
+        raise ValueError(f"Channel not found: {channel_id}")
+
+    return response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
+
+
+def _fetch_videos(
+    channel_id: str, max_results: int = 10, lean: bool = False
+) -> List[Dict]:
+    try:
+        # First get the uploads playlist ID
+        response = _youtube_list("channels", part="contentDetails", id=channel_id)
+        uploads_playlist_id = _uploads_playlist_id(response, channel_id)
+
+        # Then get the videos from the uploads playlist
+        response = _youtube_list(
+            "playlistItems",
+            part="snippet,contentDetails",
+            playlistId=uploads_playlist_id,
+            maxResults=max_results,
+        )
+
+        video_ids = [item["contentDetails"]["videoId"] for item in response["items"]]
+        videos, _ = _fetch_video_details_batch(video_ids, lean)
+
+        return videos
+    except HttpError as e:
+        raise Exception(f"Error fetching videos: {str(e)}")
+
+
+async def _fetch_videos_async(
+    channel_id: str, max_results: int = 10, lean: bool = False
+) -> List[Dict]:
+    try:
+        response = await _youtube_list_async(
+            "channels", part="contentDetails", id=channel_id
+        )
+        uploads_playlist_id = _uploads_playlist_id(response, channel_id)
+
+        response = await _youtube_list_async(
+            "playlistItems",
+            part="snippet,contentDetails",
+            playlistId=uploads_playlist_id,
+            maxResults=max_results,
+        )
+
+        video_ids = [item["contentDetails"]["videoId"] for item in response["items"]]
+        videos, _ = await _fetch_video_details_batch_async(video_ids, lean)
+
+        return videos
+    except YouTubeAPIError as e:
+        raise Exception(f"Error fetching videos: {str(e)}")
+
+
+async def _introspect_channel(
+    identifier: str, max_videos: int = 10, lean: bool = False
+) -> Dict:
+    try:
+        # Step 1: Resolve to Channel ID
+        channel_id = await _resolve_channel_id(identifier)
+
+        # Step 2 and 3: Fetch channel info and videos concurrently
+        channel_info, recent_videos = await asyncio.gather(
+            _fetch_channel_info_async(channel_id),
+            _fetch_videos_async(channel_id, max_videos, lean),
+        )
+
+        return {"channel_info": channel_info, "recent_videos": recent_videos}
+
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _search_youtube_channels(
+    query: str, max_results: int = 5, min_subscribers: int = 1000
+) -> List[Dict]:
+    try:
+        # Calculate date for one month ago, truncated to the day so repeated searches
+        # send the same request and hit the response cache
+        one_month_ago = (datetime.now(timezone.utc) - timedelta(days=30)).strftime(
+            "%Y-%m-%dT00:00:00Z"
+        )
+
+        # First, search for videos from the last month
+        response = _youtube_list(
+            "search",
+            part="snippet",
+            q=query,
+            type="video",
+            maxResults=50,  # Get more results initially to filter
+            order="viewCount",  # Sort by view count
+            publishedAfter=one_month_ago,
+        )
+
+        items = response.get("items", [])
+        video_ids = [item["id"]["videoId"] for item in items]
+        channel_ids = list(dict.fromkeys(item["snippet"]["channelId"] for item in items))
+
+        # Resolve every hit with one batched videos().list and channels().list call
+        video_items = _fetch_video_items(video_ids, "statistics")
+        channel_items = _fetch_channel_items(channel_ids, "statistics,snippet")
+
+        # Track unique channels and their best performing video
+        channel_videos = {}  # channel_id -> (video_views, video_data)
+
+        for item in items:
+            video_id = item["id"]["videoId"]
+            channel_id = item["snippet"]["channelId"]
+
+            # Skip if we already have this channel
+            if channel_id in channel_videos:
+                continue
+
+            video_data = video_items.get(video_id)
+            channel_data = channel_items.get(channel_id)
+            if video_data is None or channel_data is None:
+                continue
+
+            view_count = int(video_data["statistics"].get("viewCount", 0))
+            subscriber_count = int(channel_data["statistics"].get("subscriberCount", 0))
+
+            # Only include channels that meet the subscriber threshold
+            if subscriber_count >= min_subscribers:
+                channel_videos[channel_id] = (
+                    view_count,
+                    {
+                        "channelId": channel_id,
+                        "title": channel_data["snippet"]["title"],
+                        "description": channel_data["snippet"]["description"],
+                        "thumbnails": channel_data["snippet"]["thumbnails"],
+                        "subscriberCount": subscriber_count,
+                        "viewCount": int(
+                            channel_data["statistics"].get("viewCount", 0)
+                        ),
+                        "videoCount": int(
+                            channel_data["statistics"].get("videoCount", 0)
+                        ),
+                        "customUrl": channel_data["snippet"].get("customUrl", ""),
+                        "publishedAt": channel_data["snippet"].get("publishedAt", ""),
+                        "bestVideoViews": view_count,  # Add the view count of their best video
+                    },
+                )
+
+        # Convert to list and sort by best video views
+        channels = [data for _, data in channel_videos.values()]
+        channels.sort(key=lambda x: x["subscriberCount"], reverse=True)
+
+        # Return only the requested number of results
+        return channels[:max_results]
+
+    except Exception as e:
+        return [{"error": str(e)}]
+
+
+def _search_and_introspect_channel(query: str, video_count: int = 5) -> Dict:
+    try:
+        # Step 1: Search channels, unless this query was resolved before
+        alias = _normalize_alias("query", query)
+        channel_id = snapshot_store.channel_for_alias(alias)
+        if channel_id is None:
+            search_response = _youtube_list(
+                "search", part="snippet", q=query, type="channel", maxResults=1
+            )
+
+            if not search_response["items"]:
+                return {"error": f"No channels found for query: {query}"}
+
+            top_channel = search_response["items"][0]
+            channel_id = top_channel["id"]["channelId"]
+            snapshot_store.set_aliases(channel_id, [alias])
+
+        # Step 2: Fetch channel info
+        channel_info = _fetch_channel_info(channel_id)
+
+        # Step 3: Fetch recent videos
+        videos = _fetch_videos(channel_id, max_results=video_count)
+
+        return {"query": query, "channelInfo": channel_info, "recentVideos": videos}
+
+    except Exception as e:
+        return {"error": str(e)}
+
+
+async def _channel_uploads_playlist_id(channel_id: str) -> str:
+    """
+    Uploads playlist of a channel, remembered in the snapshot store.
+    """
+    uploads_playlist_id = snapshot_store.uploads_playlist_id(channel_id)
+    if uploads_playlist_id is None:
+        response = await _youtube_list_async(
+            "channels", part="contentDetails", id=channel_id
+        )
+        uploads_playlist_id = _uploads_playlist_id(response, channel_id)
+        snapshot_store.set_uploads_playlist_id(channel_id, uploads_playlist_id)
+    return uploads_playlist_id
+
+
+async def _fetch_upload_page(
+    playlist_id: str, page_token: Optional[str] = None
+) -> Tuple[List[Tuple[str, Optional[str]]], Optional[str]]:
+    """
+    One page of an uploads playlist as `(videoId, videoPublishedAt)` pairs, newest
+    first, and the token of the next page.
+    """
+    response = await _youtube_list_async(
+        "playlistItems",
+        part="contentDetails",
+        playlistId=playlist_id,
+        maxResults=MAX_IDS_PER_REQUEST,
+        pageToken=page_token,
+    )
+    page = [
+        (
+            item["contentDetails"]["videoId"],
+            item["contentDetails"].get("videoPublishedAt"),
+        )
+        for item in response["items"]
+    ]
+    return page, response.get("nextPageToken")
+
+
+async def _select_video_items(
+    channel_id: str,
+    max_results: int = 10,
+    months: int = 6,
+    min_duration_minutes: int = 3,
+) -> List[Dict]:
+    """
+    `videos().list` items of the channel's `max_results` most recent videos that are
+    at least `min_duration_minutes` long and no older than `months`, newest first.
+
+    The uploads playlist is paged lazily, newest first, with the next page requested
+    while the current page's videos are fetched. Paging stops once enough videos
+    qualify or the months cutoff is crossed. Videos already in the snapshot store are
+    not fetched again page by page: once a known upload shows up the stored ones are
+    scanned instead, and only the selected videos get their statistics refreshed in
+    one batched call.
+    """
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=30 * months)).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+    min_duration_seconds = min_duration_minutes * 60
+    part = "statistics,contentDetails,snippet"
+
+    try:
+        playlist_id = await _channel_uploads_playlist_id(channel_id)
+        stored = snapshot_store.videos(channel_id)
+        stored_ids = {video["videoId"] for video in stored}
+
+        selected: List[str] = []
+        items: Dict[str, Dict] = {}
+        considered = set()
+        done = False
+
+        def consider(video_id: str, published_at: str, duration_seconds: int) -> None:
+            # Uploads are in reverse chronological order; stop at the cutoff
+            nonlocal done
+            considered.add(video_id)
+            if published_at < cutoff:
+                done = True
+            elif duration_seconds >= min_duration_seconds:
+                selected.append(video_id)
+                done = len(selected) >= max_results
+
+        page_task = asyncio.create_task(_fetch_upload_page(playlist_id))
+        try:
+            while page_task is not None and not done:
+                page, next_token = await page_task
+                page_task = None
+
+                reaches_stored = any(v in stored_ids for v, _ in page)
+                oldest = next((p for _, p in reversed(page) if p), None)
+                if next_token and not reaches_stored and not (oldest and oldest < cutoff):
+                    page_task = asyncio.create_task(
+                        _fetch_upload_page(playlist_id, next_token)
+                    )
+
+                new_ids = [v for v, _ in page if v not in stored_ids]
+                if new_ids:
+                    fetched_at: Dict[str, float] = {}
+                    page_items = await _fetch_video_items_async(new_ids, part, fetched_at)
+                    _record_snapshots(channel_id, page_items, fetched_at)
+                    items.update(page_items)
+
+                for video_id, _ in page:
+                    if done:
+                        break
+                    if video_id in considered:
+                        continue
+                    if video_id in stored_ids:
+                        # Continue from the stored uploads, newest first
+                        for video in stored:
+                            if done:
+                                break
+                            if video["videoId"] not in considered:
+                                consider(
+                                    video["videoId"],
+                                    video["publishedAt"],
+                                    video["durationSeconds"],
+                                )
+                        continue
+                    item = items.get(video_id)
+                    if item is None:
+                        # Private or deleted upload
+                        considered.add(video_id)
+                        continue
+                    consider(
+                        video_id,
+                        item["snippet"]["publishedAt"],
+                        _duration_seconds(
+                            item.get("contentDetails", {}).get("duration", "PT0S")
+                        ),
+                    )
+
+                if not done and page_task is None and next_token:
+                    # The stored uploads ran out before enough videos qualified
+                    page_task = asyncio.create_task(
+                        _fetch_upload_page(playlist_id, next_token)
+                    )
+        finally:
+            if page_task is not None:
+                page_task.cancel()
+
+        # Stored videos only need fresh statistics, all in one batched call
+        refresh_ids = [v for v in selected if v not in items]
+        if refresh_ids:
+            fetched_at = {}
+            refreshed = await _fetch_video_items_async(refresh_ids, part, fetched_at)
+            _record_snapshots(channel_id, refreshed, fetched_at)
+            items.update(refreshed)
+            gone = [v for v in refresh_ids if v not in refreshed]
+            if gone:
+                snapshot_store.remove_videos(gone)
+    except YouTubeAPIError as e:
+        raise Exception(f"Error fetching video statistics: {str(e)}")
+
+    logger.info(
+        f"Statistics for {channel_id}: {len(selected)} videos selected from "
+        f"{len(considered)} uploads, {len(considered & stored_ids)} already stored"
+    )
+
+    return [items[v] for v in selected if v in items]
+
+
+async def _fetch_video_statistics(
+    channel_id: str,
+    max_results: int = 10,
+    months: int = 6,
+    min_duration_minutes: int = 3,
+) -> List[Dict]:
+    items = await _select_video_items(
+        channel_id, max_results, months, min_duration_minutes
+    )
+
+    video_stats = []
+    for video in items:
+        stats = video.get("statistics", {})
+        duration_seconds = _duration_seconds(
+            video.get("contentDetails", {}).get("duration", "PT0S")
+        )
+        video_stats.append(
+            {
+                "videoId": video["id"],
+                "viewCount": int(stats.get("viewCount", 0)),
+                "likeCount": int(stats.get("likeCount", 0)),
+                "commentCount": int(stats.get("commentCount", 0)),
+                "favoriteCount": int(stats.get("favoriteCount", 0)),
+                "durationSeconds": duration_seconds,
+                "durationMinutes": round(duration_seconds / 60, 2),
+                "publishedAt": video["snippet"]["publishedAt"],
+            }
+        )
+    return video_stats
+
+
+async def _fetch_video_stats_frame(
+    channel_id: str,
+    max_results: int = 10,
+    months: int = 6,
+    min_duration_minutes: int = 3,
+) -> VideoStatsFrame:
+    """
+    Lean, columnar variant of `_fetch_video_statistics` for pricing.
+    """
+    items = await _select_video_items(
+        channel_id, max_results, months, min_duration_minutes
+    )
+    return VideoStatsFrame.from_items(items)
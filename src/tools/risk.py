@@ -1,8 +1,10 @@
-from typing import Union, List
-from helper.helpers import _sentiment_score
+from typing import Dict, List, Optional, Union
+from .helper.sentiment import _batch_sentiment, _sentiment_score
+from .helper.tracing import traced
 from llama_index.core.tools import FunctionTool
 
 
+@traced("tool")
 def sentiment_score(texts: Union[str, List[str]]) -> float:
     """
     Calculate the average sentiment score for a single text or a list of texts using TextBlob.
@@ -24,4 +26,31 @@ def sentiment_score(texts: Union[str, List[str]]) -> float:
     return _sentiment_score(texts)
 
 
+@traced("tool")
+def sentiment_distribution(
+    texts: List[str],
+    like_counts: Optional[List[int]] = None,
+) -> Dict:
+    """
+    Score a large set of texts (e.g. thousands of comments) in one vectorized pass
+    and summarize the sentiment distribution. Scores match TextBlob polarity.
+
+    Args:
+        texts (List[str]): Texts to analyze
+        like_counts (Optional[List[int]]): Like count per text, for the like-weighted mean
+
+    Returns:
+        Dict: Distribution statistics:
+            - count: Number of texts
+            - mean: Mean sentiment score
+            - median: Median sentiment score
+            - shareNegative: Fraction of texts with a negative score
+            - likeWeightedMean: Mean weighted by 1 + like count
+    """
+    result = _batch_sentiment(texts, like_counts)
+    result.pop("scores")
+    return result
+
+
 sentiment_score_tool = FunctionTool.from_defaults(sentiment_score)
+sentiment_distribution_tool = FunctionTool.from_defaults(sentiment_distribution)
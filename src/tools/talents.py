@@ -1,8 +1,10 @@
 from typing import Annotated, Dict
-from helper.helpers import _crawl_talent_agency
+from .helper.talents import _crawl_talent_agency
+from .helper.tracing import traced
 from llama_index.core.tools import FunctionTool
 
 
+@traced("tool")
 def crawl_talent_agency(
     agency_url: str,
     limit: int = 50,
@@ -1,52 +1,14 @@
-import logging
-import requests
-from io import BytesIO
-from PIL import Image
-import torch
-import numpy as np
-from transformers import CLIPProcessor, CLIPModel
-import torch.nn.functional as F
-from typing import Annotated
-from .helper.helpers import _score_thumbnail
+import os
+from typing import Dict, List
+from .helper.thumbnails import _score_thumbnail, _score_thumbnails, _warm_up_clip
+from .helper.tracing import traced
 from llama_index.core.tools import FunctionTool
 
-# ─── Logging setup ─────────────────────────────────────────────────────────────
-# logging.basicConfig(level=logging.INFO)
-# logger = logging.getLogger(__name__)
-
-# Initialize CLIP model and processor globally
-# CLIP_MODEL_NAME = "openai/clip-vit-large-patch14"
-# logger.info(f"Loading CLIP model {CLIP_MODEL_NAME}…")
-# model = CLIPModel.from_pretrained(CLIP_MODEL_NAME)
-# processor = CLIPProcessor.from_pretrained(CLIP_MODEL_NAME)
-
-# Global parameters
-TEMPERATURE = 0.07
-SCALE = 5.0
-
-# Prompts covering design, clarity, emotion, composition
-POSITIVE_PROMPTS = [
-    "eye-catching thumbnail",
-    "bold, vibrant colors",
-    "clear, readable text",
-    "prominent faces",
-    "professional design",
-]
-NEGATIVE_PROMPTS = [
-    "blurry or out of focus",
-    "dark or underexposed",
-    "dull colors",
-    "small or unreadable text",
-    "cluttered layout",
-]
-
-
-def _download_image(url: str) -> Image.Image:
-    resp = requests.get(url, timeout=5)
-    resp.raise_for_status()
-    return Image.open(BytesIO(resp.content)).convert("RGB")
+# The CLIP model, prompts and image download live in helper/thumbnails.py, which
+# imports torch, transformers and PIL only when a thumbnail is scored.
 
 
+@traced("tool")
 def score_thumbnail(
     thumbnail_url: str,
 ) -> float:
@@ -55,4 +17,28 @@ def score_thumbnail(
     """
     return _score_thumbnail(thumbnail_url)
 
-score_thumbnail_tool = FunctionTool.from_defaults(score_thumbnail)
\ No newline at end of file
+
+@traced("tool")
+def score_thumbnails(
+    thumbnail_urls: List[str],
+    batch_size: int = 16,
+) -> List[Dict]:
+    """
+    Compute 0–1 attractiveness scores for many thumbnails in batched forward passes.
+
+    Args:
+        thumbnail_urls (List[str]): Thumbnail image URLs
+        batch_size (int): Number of images encoded per forward pass (default: 16)
+
+    Returns:
+        List[Dict]: One entry per URL, in input order, with `url` and either
+        `score` or `error`
+    """
+    return _score_thumbnails(thumbnail_urls, batch_size)
+
+# Optionally start loading CLIP in the background as soon as this tool is imported
+if os.getenv("CLIP_WARMUP", "").lower() in ("1", "true", "yes"):
+    _warm_up_clip()
+
+score_thumbnail_tool = FunctionTool.from_defaults(score_thumbnail)
+score_thumbnails_tool = FunctionTool.from_defaults(score_thumbnails)
\ No newline at end of file
@@ -0,0 +1,63 @@
+from typing import AsyncIterator, Dict, Iterable, Optional
+from .helper.valuation import _valuate_channel, _valuate_channels
+from .helper.tracing import traced
+from llama_index.core.tools import FunctionTool
+
+
+@traced("tool")
+async def valuate_channel(
+    identifier: str,
+    target_cpm: float,
+    currency: str = "EUR",
+    half_life_days: Optional[float] = None,
+) -> Dict:
+    """
+    Calculate the recommended collaboration price for a YouTube channel from its
+    recent video views and a target CPM, without any intermediate LLM steps.
+
+    Args:
+        identifier (str): Channel name, handle, URL or channel ID
+        target_cpm (float): Target cost per thousand views
+        currency (str): Currency of the target CPM (default: "EUR")
+        half_life_days (Optional[float]): Weight recent uploads, halving a video's
+            weight for every this many (positive) days it is older than the newest
+            upload (default: all videos weigh the same)
+
+    Returns:
+        Dict: Valuation including:
+            - channelId: Resolved channel ID
+            - videoCount: Number of videos the valuation is based on
+            - viewCounts: View counts of those videos
+            - medianViews: Median view count
+            - recommendedPrice: (target_cpm / 1000) * medianViews
+            - conservativePrice: The price at the lower bound of medianViewsInterval
+            - medianViewsInterval: 90% bootstrap interval of the median views
+            - viewInterval: 90% log-normal interval for the next video's views
+            - priceInterval: The same interval expressed as a price
+    """
+    return await _valuate_channel(
+        identifier, target_cpm, currency, half_life_days=half_life_days
+    )
+
+
+def valuate_channels(
+    rows: Iterable[Dict],
+    concurrency: int = 8,
+    quota_limit: Optional[int] = None,
+) -> AsyncIterator[Dict]:
+    """
+    Value many channels concurrently, yielding each row's result as it completes.
+
+    Args:
+        rows (Iterable[Dict]): Rows with `identifier`, `target_cpm` and optional `currency`
+        concurrency (int): Maximum number of channels valued at once (default: 8)
+        quota_limit (Optional[int]): YouTube API quota units the run may spend (default: no limit)
+
+    Returns:
+        AsyncIterator[Dict]: One result per row with `row`, `identifier`, `status`
+        ("ok" or "error") and either `valuation` or `error`
+    """
+    return _valuate_channels(rows, concurrency, quota_limit)
+
+
+valuate_channel_tool = FunctionTool.from_defaults(valuate_channel)
@@ -1,19 +1,22 @@
 from typing import Annotated, List, Dict
-from .helper.helpers import (
+from .helper.youtube import (
     _resolve_channel_id,
     _fetch_video_statistics,
     _fetch_video_details,
     _search_youtube_channel_videos,
     _fetch_channel_info,
     _fetch_videos,
-    _fetch_comments,
     _introspect_channel,
     _search_youtube_channels,
     _search_and_introspect_channel,
 )
+from .helper.snapshots import snapshot_store
+from .helper.comments import _fetch_comments, _stream_comment_sentiment_async
+from .helper.tracing import traced
 from llama_index.core.tools import FunctionTool
 
 
+@traced("tool")
 def fetch_video_details(video_id: str) -> Dict:
     """
     Fetch detailed information about a specific video.
@@ -30,12 +33,14 @@ def fetch_video_details(video_id: str) -> Dict:
             - viewCount: Number of views
             - likeCount: Number of likes
             - commentCount: Number of comments
-            - duration: Video duration
+            - duration: Video duration (ISO 8601)
+            - durationSeconds: Video duration in seconds
             - thumbnails: Video thumbnails
     """
     return _fetch_video_details(video_id)
 
 
+@traced("tool")
 def search_youtube_channel_videos(
     channel_id: str,
     search_term: str,
@@ -58,12 +63,14 @@ def search_youtube_channel_videos(
             - viewCount: Number of views
             - likeCount: Number of likes
             - commentCount: Number of comments
-            - duration: Video duration
+            - duration: Video duration (ISO 8601)
+            - durationSeconds: Video duration in seconds
             - thumbnails: Video thumbnails
     """
     return _search_youtube_channel_videos(channel_id, search_term, max_results)
 
 
+@traced("tool")
 def fetch_channel_info(
     channel_id: str,
 ) -> Dict:
@@ -86,16 +93,21 @@ def fetch_channel_info(
     return _fetch_channel_info(channel_id)
 
 
+@traced("tool")
 async def resolve_channel_id(
     channel_identifier: str,
 ) -> str:
     """
-    Resolve a YouTube channel handle, custom URL, or channel ID to a channel ID.
+    Resolve a YouTube channel handle, URL, channel name or channel ID to a channel ID.
+    Repeat resolutions are answered from a local index without using quota.
 
     Args:
         channel_identifier (str): Can be:
-            - Channel handle (e.g., "@channelname")
-            - Custom URL (e.g., "youtube.com/c/channelname")
+            - Channel handle (e.g., "@channelname" or "youtube.com/@channelname")
+            - Channel URL (e.g., "youtube.com/channel/UC...")
+            - Legacy username or custom URL (e.g., "youtube.com/user/name", "youtube.com/c/name")
+            - Video URL (e.g., "youtube.com/watch?v=...", "youtu.be/...", "youtube.com/shorts/...")
+            - Channel name (e.g., "Matthew Berman")
             - Channel ID (e.g., "UC...")
 
     Returns:
@@ -107,6 +119,7 @@ async def resolve_channel_id(
     return await _resolve_channel_id(channel_identifier)
 
 
+@traced("tool")
 async def fetch_video_statistics(
     channel_id: str,
     max_results: int = 10,
@@ -129,6 +142,7 @@ async def fetch_video_statistics(
             - likeCount: Number of likes
             - commentCount: Number of comments
             - favoriteCount: Number of times the video was favorited
+            - durationSeconds: Duration of the video in seconds
             - durationMinutes: Duration of the video in minutes
             - publishedAt: Publication date of the video
     """
@@ -137,9 +151,28 @@ async def fetch_video_statistics(
     )
 
 
+@traced("tool")
+def fetch_view_history(channel_id: str) -> Dict[str, List[Dict]]:
+    """
+    View-count history of a channel's videos, recorded each time its statistics were
+    fetched.
+
+    Args:
+        channel_id (str): The YouTube channel ID
+
+    Returns:
+        Dict[str, List[Dict]]: Per video ID, snapshots oldest first with:
+            - fetchedAt: Unix timestamp of the snapshot
+            - viewCount: Number of views at that time
+    """
+    return snapshot_store.channel_history(channel_id)
+
+
+@traced("tool")
 def fetch_videos(
     channel_id: str,
     max_results: int = 10,
+    lean: bool = False,
 ) -> List[Dict]:
     """
     Fetch recent videos from a channel.
@@ -147,6 +180,8 @@ def fetch_videos(
     Args:
         channel_id (str): The YouTube channel ID
         max_results (int): Maximum number of videos to fetch (default: 10)
+        lean (bool): Return only videoId, viewCount, likeCount, commentCount,
+            durationSeconds and publishedAt, without text or thumbnails (default: False)
 
     Returns:
         List[Dict]: List of video information including:
@@ -157,12 +192,14 @@ def fetch_videos(
             - viewCount: Number of views
             - likeCount: Number of likes
             - commentCount: Number of comments
-            - duration: Video duration
+            - duration: Video duration (ISO 8601)
+            - durationSeconds: Video duration in seconds
             - thumbnails: Video thumbnails
     """
-    return _fetch_videos(channel_id, max_results)
+    return _fetch_videos(channel_id, max_results, lean)
 
 
+@traced("tool")
 def fetch_comments(
     video_id: str,
     max_results: int = 100,
@@ -185,16 +222,50 @@ def fetch_comments(
     return _fetch_comments(video_id, max_results)
 
 
-def introspect_channel(
+@traced("tool")
+async def fetch_comment_sentiment(
+    video_id: str,
+    max_results: int = 5000,
+    tolerance: float = 0.02,
+) -> Dict:
+    """
+    Stream a video's comments page by page and aggregate their sentiment, stopping
+    early once the 95% confidence interval of the mean is within ±tolerance.
+
+    Args:
+        video_id (str): The YouTube video ID
+        max_results (int): Maximum number of comments to read (default: 5000)
+        tolerance (float): Target half-width of the confidence interval (default: 0.02)
+
+    Returns:
+        Dict: Sentiment summary including:
+            - videoId: Video ID
+            - count: Number of comments scored (0 for a video without comments,
+              in which case the statistics below are null)
+            - mean: Mean sentiment score (-1.0 to 1.0)
+            - std: Standard deviation of the scores
+            - shareNegative: Fraction of negative comments
+            - likeWeightedMean: Mean weighted by 1 + like count
+            - confidenceHalfwidth: Half-width of the 95% interval for the mean
+            - stoppedEarly: Whether paging stopped before max_results
+    """
+    return await _stream_comment_sentiment_async(video_id, max_results, tolerance)
+
+
+@traced("tool")
+async def introspect_channel(
     identifier: str,
     max_videos: int = 10,
+    lean: bool = False,
 ) -> Dict:
     """
     Resolve the identifier to a channel ID, fetch channel info and recent videos.
+    With `lean`, videos carry only their statistics, duration and publish date.
     """
-    return _introspect_channel(identifier, max_videos)
+    return await _introspect_channel(identifier, max_videos, lean)
 
 
+@traced("tool")
 def search_youtube_channels(
     query: str,
     max_results: int = 5,
@@ -206,6 +277,7 @@ def search_youtube_channels(
     return _search_youtube_channels(query, max_results)
 
 
+@traced("tool")
 def search_and_introspect_channel(
     query: str,
     video_count: int = 5,
@@ -223,8 +295,10 @@ search_youtube_channel_videos_tool = FunctionTool.from_defaults(
 fetch_channel_info_tool = FunctionTool.from_defaults(fetch_channel_info)
 resolve_channel_id_tool = FunctionTool.from_defaults(resolve_channel_id)
 fetch_video_statistics_tool = FunctionTool.from_defaults(fetch_video_statistics)
+fetch_view_history_tool = FunctionTool.from_defaults(fetch_view_history)
 fetch_videos_tool = FunctionTool.from_defaults(fetch_videos)
 fetch_comments_tool = FunctionTool.from_defaults(fetch_comments)
+fetch_comment_sentiment_tool = FunctionTool.from_defaults(fetch_comment_sentiment)
 introspect_channel_tool = FunctionTool.from_defaults(introspect_channel)
 search_youtube_channels_tool = FunctionTool.from_defaults(search_youtube_channels)
 search_and_introspect_channel_tool = FunctionTool.from_defaults(
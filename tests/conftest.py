@@ -0,0 +1,10 @@
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Keep the module-level caches in memory and never require real credentials
+for name in ("YOUTUBE_CACHE_PATH", "YOUTUBE_SNAPSHOT_PATH", "YOUTUBE_QUOTA_PATH"):
+    os.environ.setdefault(name, "")
+os.environ.setdefault("YOUTUBE_API_KEY", "test")
@@ -0,0 +1,108 @@
+import sqlite3
+import types
+
+import pytest
+
+from src.tools.helper import cache
+from src.tools.helper.cache import STATISTICS_TTL, ResponseCache, cache_key, ttl_for
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(cache, "time", types.SimpleNamespace(time=lambda: now[0]))
+
+    def advance(seconds):
+        now[0] += seconds
+        return now[0]
+
+    advance.now = lambda: now[0]
+    return advance
+
+
+def test_entries_expire_after_their_ttl(clock):
+    responses = ResponseCache(path=None)
+    responses.set("k", {"items": [1]}, ttl=10)
+
+    assert responses.get("k") == {"items": [1]}
+    clock(10)
+    assert responses.get("k") == {"items": [1]}
+    clock(1)
+    assert responses.get("k") is None
+    assert responses.get("unknown") is None
+    assert responses.stats() == {
+        "hits": 2,
+        "diskHits": 0,
+        "misses": 2,
+        "staleHits": 0,
+        "memoryEntries": 1,
+    }
+
+
+def test_get_stale_serves_expired_entries_up_to_max_stale(clock):
+    responses = ResponseCache(path=None)
+    responses.set("k", "value", ttl=10)
+    clock(110)
+
+    assert responses.get("k") is None
+    assert responses.get_stale("k", max_stale=50) is None
+    assert responses.get_stale("k", max_stale=200) == "value"
+    assert responses.get_stale("unknown") is None
+    assert responses.stale_hits == 1
+
+
+def test_disk_tier_survives_restarts(clock, tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    ResponseCache(path).set("k", [1, 2], ttl=60)
+    fetched = clock.now()
+
+    restarted = ResponseCache(path)
+    assert restarted.get("k") == [1, 2]
+    assert restarted.disk_hits == 1 and restarted.hits == 1
+    assert restarted.fetched_at("k") == fetched
+
+    clock(120)
+    fresh = ResponseCache(path)
+    assert fresh.get("k") is None and fresh.misses == 1
+    assert fresh.get_stale("k") == [1, 2]
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    responses = ResponseCache(path=None, max_entries=2)
+    responses.set("a", 1, ttl=60)
+    responses.set("b", 2, ttl=60)
+    responses.get("a")
+    responses.set("c", 3, ttl=60)
+
+    assert responses.get("b") is None
+    assert responses.get("a") == 1 and responses.get("c") == 3
+
+
+def test_legacy_cache_files_are_migrated(clock, tmp_path):
+    path = str(tmp_path / "legacy.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO responses VALUES ('k', '\"old\"', ?)", (clock.now() + 60,))
+    conn.commit()
+    conn.close()
+
+    responses = ResponseCache(path)
+    assert responses.get("k") == "old"
+    assert responses.fetched_at("k") is None
+    responses.set("n", "new", ttl=60)
+    assert ResponseCache(path).fetched_at("n") == clock.now()
+
+
+def test_cache_key_ignores_parameter_and_part_order():
+    key = cache_key("videos", "snippet,statistics", {"id": "a,b", "maxResults": 2})
+    assert key == cache_key(
+        "videos", "statistics, snippet", {"maxResults": 2, "id": "a,b", "pageToken": None}
+    )
+    assert key != cache_key("videos", "snippet,statistics", {"id": "a,c", "maxResults": 2})
+
+
+def test_statistics_responses_get_the_short_ttl():
+    assert ttl_for("videos", "snippet,statistics") == STATISTICS_TTL
+    assert ttl_for("channels", "snippet") > ttl_for("search", "snippet") > STATISTICS_TTL
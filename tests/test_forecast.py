@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from src.tools.helper.forecast import (
+    _predict_next_video_views,
+    _predict_next_video_views_batch,
+)
+
+stats = pytest.importorskip("scipy.stats")
+
+MODES = ["lower", "upper", "two-sided"]
+
+
+def _scipy_interval(views, confidence_level, interval_type):
+    """
+    The original implementation: a scipy log-normal fit with the location fixed at 0.
+    """
+    shape, loc, scale = stats.lognorm.fit(np.asarray(views, dtype=float), floc=0)
+    alpha = 1.0 - confidence_level
+    if interval_type == "lower":
+        return stats.lognorm.ppf(alpha, shape, loc=loc, scale=scale), np.inf
+    if interval_type == "upper":
+        return -np.inf, stats.lognorm.ppf(confidence_level, shape, loc=loc, scale=scale)
+    return (
+        stats.lognorm.ppf(alpha / 2, shape, loc=loc, scale=scale),
+        stats.lognorm.ppf(1 - alpha / 2, shape, loc=loc, scale=scale),
+    )
+
+
+def _histories(seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        rng.lognormal(rng.uniform(6, 13), rng.uniform(0.1, 2.0), size=n).round() + 1
+        for n in (2, 3, 5, 10, 10, 17, 50)
+    ]
+
+
+def _assert_matches_scipy(lower, upper, histories, confidence_level, interval_type):
+    for i, views in enumerate(histories):
+        expected = _scipy_interval(views, confidence_level, interval_type)
+        assert lower[i] == pytest.approx(expected[0], rel=1e-6)
+        assert upper[i] == pytest.approx(expected[1], rel=1e-6)
+
+
+@pytest.mark.parametrize("interval_type", MODES)
+@pytest.mark.parametrize("confidence_level", [0.8, 0.9, 0.99])
+def test_ragged_batch_matches_scipy_fit(interval_type, confidence_level):
+    histories = _histories()
+    lower, upper = _predict_next_video_views_batch(
+        [list(h) for h in histories], confidence_level, interval_type
+    )
+    _assert_matches_scipy(lower, upper, histories, confidence_level, interval_type)
+
+
+@pytest.mark.parametrize("interval_type", MODES)
+def test_padded_batch_matches_scipy_fit(interval_type):
+    histories = _histories(1)
+    width = max(len(h) for h in histories)
+    mask = np.arange(width) < np.array([len(h) for h in histories])[:, None]
+
+    # Zero padding flagged by an explicit mask
+    padded = np.zeros(mask.shape)
+    padded[mask] = np.concatenate(histories)
+    lower, upper = _predict_next_video_views_batch(padded, 0.9, interval_type, mask=mask)
+    _assert_matches_scipy(lower, upper, histories, 0.9, interval_type)
+
+    # NaN padding, masked by default
+    padded[~mask] = np.nan
+    lower, upper = _predict_next_video_views_batch(padded, 0.9, interval_type)
+    _assert_matches_scipy(lower, upper, histories, 0.9, interval_type)
+
+
+@pytest.mark.parametrize("interval_type", MODES)
+def test_single_channel_matches_scipy_fit(interval_type):
+    views = [1200, 5400, 830, 22000, 4100, 9000]
+    assert _predict_next_video_views(views, 0.9, interval_type) == pytest.approx(
+        _scipy_interval(views, 0.9, interval_type), rel=1e-6
+    )
+
+
+def test_channels_without_history_get_nan():
+    lower, upper = _predict_next_video_views_batch([[100, 200, 400], []])
+    assert np.isfinite(lower[0]) and np.isfinite(upper[0])
+    assert np.isnan(lower[1]) and np.isnan(upper[1])
+
+
+def test_invalid_input_is_rejected():
+    with pytest.raises(ValueError):
+        _predict_next_video_views([])
+    with pytest.raises(ValueError, match="rows \\[1\\]"):
+        _predict_next_video_views_batch([[100, 200], [100, 0]])
+    with pytest.raises(ValueError):
+        _predict_next_video_views_batch([[100, 200]], interval_type="sideways")
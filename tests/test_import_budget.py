@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = [
+    "torch",
+    "transformers",
+    "scipy",
+    "textblob",
+    "firecrawl",
+    "PIL",
+    "googleapiclient.discovery",
+]
+
+# Generous wall-clock ceiling for the imports; the YouTube path takes ~0.2 s
+IMPORT_BUDGET_SECONDS = 3.0
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import src.tools.helper
+import src.tools.helper.youtube
+elapsed = time.perf_counter() - start
+print(json.dumps({"modules": sorted(sys.modules), "elapsed": elapsed}))
+"""
+
+
+def _import_in_subprocess(tmp_path):
+    env = dict(
+        os.environ,
+        PYTHONPATH=REPO_ROOT,
+        YOUTUBE_CACHE_PATH="",
+        YOUTUBE_SNAPSHOT_PATH="",
+        YOUTUBE_QUOTA_PATH="",
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_helper_imports_skip_heavy_dependencies(tmp_path):
+    loaded = set(_import_in_subprocess(tmp_path)["modules"])
+    assert [m for m in HEAVY_MODULES if m in loaded] == []
+
+
+def test_helper_imports_within_time_budget(tmp_path):
+    assert _import_in_subprocess(tmp_path)["elapsed"] < IMPORT_BUDGET_SECONDS
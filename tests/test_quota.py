@@ -0,0 +1,135 @@
+import asyncio
+import time
+import types
+
+import pytest
+
+from src.tools.helper import quota
+from src.tools.helper.quota import (
+    BULK,
+    DAY,
+    INTERACTIVE,
+    QuotaBudget,
+    QuotaExceededError,
+    QuotaScheduler,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        quota,
+        "time",
+        types.SimpleNamespace(monotonic=lambda: now[0], time=time.time, sleep=time.sleep),
+    )
+
+    def advance(seconds):
+        now[0] += seconds
+
+    return advance
+
+
+def test_bulk_requests_stop_at_the_interactive_reserve(clock):
+    scheduler = QuotaScheduler(daily_limit=1000, burst=1000, reserve=0.2, path=None)
+    for _ in range(8):
+        scheduler.acquire("search", BULK)
+
+    with pytest.raises(QuotaExceededError, match="bulk"):
+        scheduler.acquire("search", BULK)
+    assert scheduler.acquire("search", INTERACTIVE) == 100
+    assert scheduler.acquire("search", INTERACTIVE) == 100
+    with pytest.raises(QuotaExceededError, match="interactive"):
+        scheduler.acquire("videos", INTERACTIVE)
+    assert scheduler.used == 1000
+
+
+def test_bulk_requests_are_paced_in_arrival_order(clock):
+    # 100 units per second, 200 units of burst
+    scheduler = QuotaScheduler(daily_limit=100 * DAY, burst=200, path=None)
+    waits = [scheduler._reserve("search", BULK)[1] for _ in range(5)]
+    assert waits == pytest.approx([0, 0, 1, 2, 3])
+
+    # Waiting out the queue refills the bucket for the next request
+    clock(3)
+    assert scheduler._reserve("search", BULK)[1] == pytest.approx(1)
+
+
+def test_interactive_requests_never_wait_but_slow_bulk_down(clock):
+    scheduler = QuotaScheduler(daily_limit=100 * DAY, burst=200, path=None)
+    for _ in range(3):
+        assert scheduler._reserve("search", INTERACTIVE) == (100, 0.0)
+    assert scheduler._reserve("search", BULK)[1] == pytest.approx(2)
+
+
+def test_bulk_waits_longer_than_max_wait_are_refused(clock):
+    scheduler = QuotaScheduler(daily_limit=100 * DAY, burst=200, max_wait=2.5, path=None)
+    for _ in range(4):
+        scheduler._reserve("search", BULK)
+    used = scheduler.used
+
+    with pytest.raises(QuotaExceededError, match="would wait 3s"):
+        scheduler._reserve("search", BULK)
+    assert scheduler.used == used
+
+
+def test_default_burst_is_an_hour_of_refill():
+    assert QuotaScheduler(daily_limit=24_000, path=None).burst == 1000
+
+
+def test_cancelled_waiters_release_their_reservation():
+    scheduler = QuotaScheduler(daily_limit=100 * DAY, burst=100, path=None)
+
+    async def run():
+        await scheduler.acquire_async("search", BULK)
+        waiter = asyncio.ensure_future(scheduler.acquire_async("search", BULK))
+        await asyncio.sleep(0.05)
+        assert scheduler.used == 200
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(run())
+    assert scheduler.used == 100
+    assert scheduler.stats()["byResource"] == {"search": 100}
+    # The released tokens are available again
+    assert scheduler._reserve("search", BULK)[1] < 1.1
+
+
+def test_usage_is_saved_in_batches(clock, tmp_path):
+    path = str(tmp_path / "quota.sqlite")
+    scheduler = QuotaScheduler(path=path, save_interval=5)
+    for _ in range(100):
+        scheduler.acquire("videos", INTERACTIVE)
+    assert QuotaScheduler(path=path).used == 0
+
+    clock(5)
+    scheduler.acquire("videos", INTERACTIVE)
+    assert QuotaScheduler(path=path).used == 101
+
+    scheduler.acquire("videos", INTERACTIVE)
+    scheduler.flush()
+    assert QuotaScheduler(path=path).used == 102
+
+
+def test_exhaust_marks_the_day_as_spent_and_saves_it(tmp_path):
+    path = str(tmp_path / "quota.sqlite")
+    scheduler = QuotaScheduler(daily_limit=1000, path=path, save_interval=3600)
+    scheduler.exhaust()
+    assert QuotaScheduler(daily_limit=1000, path=path).remaining == 0
+    with pytest.raises(QuotaExceededError):
+        scheduler.acquire("videos", INTERACTIVE)
+
+
+def test_refused_requests_are_refunded_to_the_budget(monkeypatch):
+    scheduler = QuotaScheduler(daily_limit=150, path=None)
+    monkeypatch.setattr(quota, "quota_scheduler", scheduler)
+    budget = QuotaBudget(limit=500)
+    quota.use_quota_budget(budget)
+    try:
+        assert quota.charge_quota("search") == 100
+        with pytest.raises(QuotaExceededError):
+            quota.charge_quota("search")
+    finally:
+        quota.use_quota_budget(None)
+    assert budget.used == 100
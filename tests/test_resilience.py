@@ -0,0 +1,197 @@
+import asyncio
+import json
+import time
+import types
+from email.utils import formatdate
+
+import httplib2
+import httpx
+import pytest
+from googleapiclient.errors import HttpError
+
+from src.tools.helper import resilience
+from src.tools.helper.async_youtube import YouTubeAPIError
+from src.tools.helper.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    _hedged,
+    call_with_retries,
+    is_transient,
+    retry_after,
+    unavailable_error,
+)
+
+
+def _http_error(status, message="error", headers=None):
+    resp = httplib2.Response({"status": status, **(headers or {})})
+    return HttpError(resp, json.dumps({"error": {"message": message}}).encode())
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        resilience,
+        "time",
+        types.SimpleNamespace(monotonic=lambda: now[0], time=time.time, sleep=lambda s: None),
+    )
+
+    def advance(seconds):
+        now[0] += seconds
+
+    return advance
+
+
+@pytest.mark.parametrize(
+    "error, transient",
+    [
+        (_http_error(503), True),
+        (_http_error(429), True),
+        (_http_error(403, "Rate Limit Exceeded"), True),
+        (_http_error(403, "The request cannot be completed because you have exceeded your quota."), False),
+        (_http_error(404), False),
+        (YouTubeAPIError(500, "Backend Error"), True),
+        (YouTubeAPIError(403, "rateLimitExceeded"), True),
+        (YouTubeAPIError(400, "Invalid filter"), False),
+        (httpx.ConnectError("dns failure"), True),
+        (ConnectionResetError("reset"), True),
+        (httplib2.ServerNotFoundError("no server"), True),
+        (ValueError("bug"), False),
+    ],
+)
+def test_is_transient(error, transient):
+    assert is_transient(error) is transient
+
+
+def test_retry_after_reads_seconds_and_http_dates():
+    assert retry_after(YouTubeAPIError(429, "slow down", {"Retry-After": "7"})) == 7.0
+    assert retry_after(_http_error(503, headers={"retry-after": "3"})) == 3.0
+
+    later = formatdate(time.time() + 20, usegmt=True)
+    assert retry_after(YouTubeAPIError(503, "x", {"retry-after": later})) == pytest.approx(20, abs=2)
+    past = formatdate(time.time() - 60, usegmt=True)
+    assert retry_after(YouTubeAPIError(503, "x", {"retry-after": past})) == 0.0
+
+    assert retry_after(YouTubeAPIError(503, "x", {"retry-after": "soon"})) is None
+    assert retry_after(YouTubeAPIError(503, "x")) is None
+    assert retry_after(ValueError("x")) is None
+
+
+def test_circuit_opens_half_opens_and_closes(clock):
+    breaker = CircuitBreaker("videos", threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    clock(30)
+    assert breaker.state == "half-open"
+    breaker.allow()  # the single probe
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.allow()
+
+
+def test_failed_probe_reopens_the_circuit(clock):
+    breaker = CircuitBreaker("videos", threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock(30)
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    clock(29)
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_transient_failures_are_retried(clock, monkeypatch):
+    monkeypatch.setattr(resilience, "MAX_RETRIES", 3)
+    monkeypatch.setattr(resilience, "_breakers", {})
+    attempts = []
+
+    def send():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise _http_error(503)
+        return {"items": []}
+
+    assert call_with_retries("videos", send) == {"items": []}
+    assert len(attempts) == 3
+
+
+def test_permanent_failures_are_not_retried(clock, monkeypatch):
+    monkeypatch.setattr(resilience, "_breakers", {})
+    attempts = []
+
+    def send():
+        attempts.append(1)
+        raise _http_error(404)
+
+    with pytest.raises(HttpError):
+        call_with_retries("videos", send)
+    assert len(attempts) == 1
+    assert resilience.circuit_breaker("videos").state == "closed"
+
+
+def test_outages_become_503_api_errors():
+    sync_error = unavailable_error("videos", httpx.ConnectError("dns failure"))
+    assert isinstance(sync_error, HttpError) and sync_error.resp.status == 503
+    assert "videos endpoint unavailable: dns failure" in str(sync_error)
+
+    async_error = unavailable_error("videos", CircuitOpenError("open"), asynchronous=True)
+    assert isinstance(async_error, YouTubeAPIError)
+    assert async_error.status_code == 503 and async_error.reason == "open"
+
+
+def test_hedged_call_cancels_the_slower_request():
+    delays = [0.5, 0.01]
+    cancelled = []
+
+    async def send():
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return delay
+
+    async def run():
+        result = await _hedged(send, hedge_after=0.05)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == 0.01
+    assert cancelled == [0.5]
+
+
+def test_hedged_call_cancels_everything_when_the_caller_is_cancelled():
+    cancelled = []
+
+    async def send():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+
+    async def run(hedge_after):
+        task = asyncio.ensure_future(_hedged(send, hedge_after))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+        # Checked before asyncio.run() cancels any leftover task on shutdown
+        return list(cancelled)
+
+    assert asyncio.run(run(hedge_after=5)) == [1]  # cancelled before the duplicate is sent
+    cancelled.clear()
+    assert asyncio.run(run(hedge_after=0.01)) == [1, 1]  # both requests in flight
@@ -0,0 +1,113 @@
+import os
+import random
+
+import numpy as np
+import pytest
+
+from src.tools.helper.sentiment import (
+    RunningSentiment,
+    _batch_sentiment,
+    _lexicon,
+    _polarity_scores,
+)
+
+TextBlob = pytest.importorskip("textblob").TextBlob
+
+COMMENTS_PATH = os.path.join(os.path.dirname(__file__), "data", "comments.txt")
+
+# The tolerance documented next to the batch engine in sentiment.py
+REAL_COMMENT_AGREEMENT = 0.99
+WORD_SALAD_AGREEMENT = 0.95
+MEAN_TOLERANCE = 0.01
+
+
+def _comments():
+    with open(COMMENTS_PATH, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def _word_salad(count=2000, seed=0):
+    """
+    Random texts dense in lexicon words, negations, punctuation and emoticons.
+    """
+    words = sorted(w for w in _lexicon().vocab if w.isalpha())
+    filler = "the a is it this video i you was so and but to of in my".split()
+    marks = ["not", "never", "no", "!", ".", ",", "?", "...", ":)", ":(", "(!)"]
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        tokens = []
+        for _ in range(rng.randint(2, 14)):
+            pool = rng.choices([words, filler, marks], weights=[35, 45, 20])[0]
+            tokens.append(rng.choice(pool))
+        texts.append(" ".join(tokens))
+    return texts
+
+
+def _compare(texts):
+    ours = _polarity_scores(texts)
+    reference = np.array([TextBlob(text).sentiment.polarity for text in texts])
+    agreement = np.mean(np.isclose(ours, reference, rtol=0, atol=1e-9))
+    return ours, reference, agreement
+
+
+def test_real_comments_match_textblob():
+    ours, reference, agreement = _compare(_comments())
+    assert agreement >= REAL_COMMENT_AGREEMENT
+    assert abs(ours.mean() - reference.mean()) <= MEAN_TOLERANCE
+    assert abs(np.median(ours) - np.median(reference)) <= MEAN_TOLERANCE
+
+
+def test_word_salad_stays_within_tolerance():
+    ours, reference, agreement = _compare(_word_salad())
+    assert agreement >= WORD_SALAD_AGREEMENT
+    assert abs(ours.mean() - reference.mean()) <= MEAN_TOLERANCE
+    assert abs(np.median(ours) - np.median(reference)) <= MEAN_TOLERANCE
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "I'm confused, what happened at 5:32?",
+        "great:)",
+        "not good",
+        "not bad at all!",
+        "very very disappointing",
+        "really not good",
+        "good (!)",
+        "good ( ! ) really",
+    ],
+)
+def test_edge_cases_match_textblob(text):
+    assert _polarity_scores([text])[0] == pytest.approx(
+        TextBlob(text).sentiment.polarity, abs=1e-9
+    )
+
+
+def test_summary_without_comments():
+    summary = RunningSentiment().summary(0.9)
+    assert summary["count"] == 0
+    assert summary["confidenceLevel"] == 0.9
+    assert all(
+        summary[key] is None
+        for key in ("mean", "std", "shareNegative", "likeWeightedMean", "confidenceHalfwidth")
+    )
+
+
+def test_chunked_updates_match_one_shot_statistics():
+    texts = _comments()
+    likes = np.random.default_rng(0).integers(0, 50, size=len(texts))
+    one_shot = _batch_sentiment(texts, likes)
+
+    running = RunningSentiment()
+    bounds = [0, 1, 2, 30, 31, 77, len(texts)]
+    for start, stop in zip(bounds, bounds[1:]):
+        running.update(_polarity_scores(texts[start:stop]), likes[start:stop])
+    running.update([])
+
+    summary = running.summary()
+    assert summary["count"] == one_shot["count"] == len(texts)
+    assert summary["mean"] == pytest.approx(one_shot["mean"], abs=1e-12)
+    assert summary["std"] == pytest.approx(np.std(one_shot["scores"], ddof=1), abs=1e-12)
+    assert summary["shareNegative"] == pytest.approx(one_shot["shareNegative"])
+    assert summary["likeWeightedMean"] == pytest.approx(one_shot["likeWeightedMean"], abs=1e-12)
@@ -0,0 +1,51 @@
+import json
+import threading
+
+from src.tools.helper import tracing
+
+
+def test_exported_spans_are_written_in_batches_off_the_request_path(tmp_path, monkeypatch):
+    path = tmp_path / "spans.jsonl"
+    writes = []
+    release = threading.Event()
+    export_spans = tracing.export_spans
+
+    def blocking_export(spans, *args):
+        # Hold the writer on its first batch so the remaining spans queue up
+        release.wait(5)
+        writes.append(len(spans))
+        export_spans(spans, *args)
+
+    monkeypatch.setattr(tracing, "export_spans", blocking_export)
+    exporter = tracing.SpanExporter(str(path))
+    monkeypatch.setattr(tracing, "TRACE_EXPORT_PATH", str(path))
+    monkeypatch.setattr(tracing, "_exporter", exporter)
+
+    with tracing.collect_spans() as collector:
+        for i in range(200):
+            with tracing.trace_span(f"call-{i}", "api", quota_units=1):
+                pass
+    assert writes == []
+
+    release.set()
+    tracing.flush_spans(5)
+    exporter.close()
+
+    names = [json.loads(line)["name"] for line in path.read_text().splitlines()]
+    assert names == [f"call-{i}" for i in range(200)]
+    assert len(collector.spans) == 200
+    assert sum(writes) == 200 and len(writes) <= 2
+
+
+def test_export_errors_are_logged_not_raised(tmp_path, monkeypatch, caplog):
+    path = tmp_path / "missing" / "spans.jsonl"
+    exporter = tracing.SpanExporter(str(path))
+    monkeypatch.setattr(tracing, "TRACE_EXPORT_PATH", str(path))
+    monkeypatch.setattr(tracing, "_exporter", exporter)
+
+    with tracing.trace_span("call", "api"):
+        pass
+    tracing.flush_spans(5)
+    exporter.close()
+
+    assert "Could not export 1 spans" in caplog.text